@@ -0,0 +1,229 @@
+"""
+Deploy an agent variant to Vertex AI Reasoning Engine.
+
+Usage:
+    python deploy.py --variant {debug,v2,v3}
+
+All variants share one requirements manifest and one content-addressed
+staging copy of src/, so redeploying an unchanged tree (or switching
+variant) doesn't rebuild a different dependency set or re-copy sources.
+"""
+
+import argparse
+import hashlib
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Add project directory to path for local imports during deployment
+sys.path.insert(0, BASE_DIR)
+
+# Content-addressed staging copies of src/, one per distinct tree
+STAGING_ROOT = os.path.join(BASE_DIR, ".deploy_staging")
+
+STAGING_BUCKET = "gs://linear-semantic-agents-staging"
+
+# Single requirements manifest for every variant
+REQUIREMENTS = [
+    "google-cloud-aiplatform[reasoningengine]>=1.48.0",
+    "google-cloud-firestore",
+    "google-auth",
+    "httpx[http2]",
+    "h2",
+    "orjson",
+    "tenacity",
+    "pydantic-settings",
+    "numpy",
+    "pandas",
+    "python-dotenv",
+    "structlog",
+    "langchain",
+    "langchain-google-vertexai"
+]
+
+
+class Variant(NamedTuple):
+    """A deployable agent wrapper."""
+    module: str                    # Module defining the agent class
+    agent_class: str               # Agent class name
+    display_name: str
+    description: Optional[str]
+    bundle_src: bool               # Ship src/ as an extra package
+    record_resource: bool          # Write reasoning_engine_resource.txt
+
+
+VARIANTS: Dict[str, Variant] = {
+    "debug": Variant(
+        module="deploy_debug_agent",
+        agent_class="DebugAgent",
+        display_name="Debug Identity Agent",
+        description=None,
+        bundle_src=False,
+        record_resource=False
+    ),
+    "v2": Variant(
+        module="src.reasoning_engine_agent",
+        agent_class="LinearReasoningAgent",
+        display_name="Linear Semantic Agent",
+        description="AI agent for validating and categorizing Linear tasks",
+        bundle_src=True,
+        record_resource=True
+    ),
+    "v3": Variant(
+        module="deploy_v3",
+        agent_class="LinearReasoningAgent",
+        display_name="Linear Semantic Agent v3",
+        description="AI agent for validating and categorizing Linear tasks",
+        bundle_src=True,
+        record_resource=True
+    ),
+}
+
+
+def _package_files(base_dir: str) -> List[Tuple[str, str]]:
+    """List (relative path, absolute path) of files to bundle, sorted."""
+    files = []
+    src_path = os.path.join(base_dir, "src")
+    for root, dirs, names in os.walk(src_path):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(names):
+            if name.endswith((".pyc", ".pyo")):
+                continue
+            path = os.path.join(root, name)
+            files.append((os.path.relpath(path, base_dir), path))
+
+    # Mapache context document lives next to the project directory
+    mapache_doc = os.path.join(base_dir, "..", "mapache_context_document.md")
+    if os.path.exists(mapache_doc):
+        files.append(("mapache_context_document.md", mapache_doc))
+    return files
+
+
+def stage_package(base_dir: str = BASE_DIR) -> str:
+    """
+    Get a staging directory holding src/ (and the mapache context doc).
+
+    The directory is named after a SHA-256 of the bundled files, so an
+    unchanged tree reuses the previous staging copy instead of copying
+    src/ into a fresh temp dir on every deploy.
+
+    Args:
+        base_dir: Project directory containing src/
+
+    Returns:
+        Path of the staging directory
+    """
+    files = _package_files(base_dir)
+    digest = hashlib.sha256()
+    for rel_path, path in files:
+        digest.update(rel_path.encode())
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    stage_dir = os.path.join(STAGING_ROOT, f"src-{digest.hexdigest()[:12]}")
+
+    if os.path.isdir(stage_dir):
+        print(f"Reusing staged package: {stage_dir}")
+        return stage_dir
+
+    # Build next to the final path, then rename so a failed copy never
+    # leaves a half-populated directory that would be reused
+    os.makedirs(STAGING_ROOT, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=STAGING_ROOT)
+    for rel_path, path in files:
+        dest = os.path.join(tmp_dir, rel_path)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copy2(path, dest)
+    shutil.move(tmp_dir, stage_dir)
+    print(f"Staged package: {stage_dir}")
+    return stage_dir
+
+
+def load_agent(variant: Variant):
+    """
+    Instantiate the variant's agent wrapper.
+
+    The defining module is registered for pickling by value, so the
+    wrapper class ships inline with the pickle rather than as a reference
+    to a deploy-side module the runtime can't import.
+    """
+    import cloudpickle
+
+    module = importlib.import_module(variant.module)
+    cloudpickle.register_pickle_by_value(module)
+    return getattr(module, variant.agent_class)()
+
+
+def deploy(variant_name: str) -> None:
+    """
+    Deploy one agent variant.
+
+    Args:
+        variant_name: Key of VARIANTS
+    """
+    import vertexai
+    from vertexai.preview import reasoning_engines
+    from src.config.settings import settings
+
+    variant = VARIANTS[variant_name]
+    print(f"Starting deployment of '{variant_name}' to Vertex AI Reasoning Engine...")
+
+    # Initialize Vertex AI
+    vertexai.init(
+        project=settings.gcp_project_id,
+        location=settings.gcp_region,
+        staging_bucket=STAGING_BUCKET
+    )
+
+    original_dir = os.getcwd()
+    try:
+        agent = load_agent(variant)
+        extra_packages = None
+        if variant.bundle_src:
+            # Change to staging directory so the package is bundled as "src"
+            os.chdir(stage_package())
+            extra_packages = ["src"]
+
+        remote_agent = reasoning_engines.ReasoningEngine.create(
+            agent,
+            requirements=REQUIREMENTS,
+            display_name=variant.display_name,
+            description=variant.description,
+            extra_packages=extra_packages
+        )
+
+        print("Deployment successful!")
+        print(f"Reasoning Engine Resource Name: {remote_agent.resource_name}")
+
+        # Save the resource name to a file for later use
+        if variant.record_resource:
+            resource_file = os.path.join(original_dir, "reasoning_engine_resource.txt")
+            with open(resource_file, "w") as f:
+                f.write(remote_agent.resource_name)
+    except Exception as e:
+        print(f"Deployment failed: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        os.chdir(original_dir)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--variant",
+        choices=sorted(VARIANTS),
+        default="v3",
+        help="Agent variant to deploy (default: v3)"
+    )
+    args = parser.parse_args(argv)
+    deploy(args.variant)
+
+
+if __name__ == "__main__":
+    main()
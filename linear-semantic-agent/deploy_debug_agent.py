@@ -1,49 +1,76 @@
 
 import os
-import vertexai
-from vertexai.preview import reasoning_engines
+import time
 from google.cloud import firestore
 import google.auth
 
+# Environment variables safe and useful to echo back from the runtime
+ENV_WHITELIST = (
+    "K_SERVICE",
+    "K_REVISION",
+    "PORT",
+    "GOOGLE_CLOUD_PROJECT",
+    "CLOUD_RUN_JOB",
+)
+
+# How long a listing of top-level Firestore collections is reused
+COLLECTIONS_CACHE_TTL_SECONDS = 60
+
 class DebugAgent:
+    def __init__(self):
+        self._creds = None
+        self._project = None
+        self._identity = "unknown"
+        self._db = None
+        self._coll_cache = None  # (monotonic timestamp, collection ids)
+
     def set_up(self):
-        pass
-        
+        try:
+            self._ensure_clients()
+        except Exception:
+            # Surface the failure from query() instead of breaking deployment
+            pass
+
+    def _ensure_clients(self):
+        """Resolve credentials and the Firestore client once per instance."""
+        if self._db is not None:
+            return
+        self._creds, self._project = google.auth.default()
+        self._identity = getattr(self._creds, 'service_account_email', 'unknown')
+        self._db = firestore.Client(project="linear-semantic-agents")
+
+    def _list_collections(self):
+        """Return top-level collection IDs, cached for a short TTL."""
+        now = time.monotonic()
+        if self._coll_cache and now - self._coll_cache[0] < COLLECTIONS_CACHE_TTL_SECONDS:
+            return self._coll_cache[1]
+        collections = [c.id for c in self._db.collections()]
+        self._coll_cache = (now, collections)
+        return collections
+
     def query(self, text: str):
         try:
-            credentials, project = google.auth.default()
-            identity = getattr(credentials, 'service_account_email', 'unknown')
-            
-            db = firestore.Client(project="linear-semantic-agents")
-            collections = [c.id for c in db.collections()]
+            self._ensure_clients()
+            collections = self._list_collections()
             
             return {
-                "identity": identity,
-                "project": project,
+                "identity": self._identity,
+                "project": self._project,
                 "collections": collections,
-                "env": dict(os.environ)
+                "env": {k: os.environ[k] for k in ENV_WHITELIST if k in os.environ}
             }
         except Exception as e:
             import traceback
             return {
                 "error": str(e),
                 "traceback": traceback.format_exc(),
-                "identity": identity if 'identity' in locals() else 'unknown'
+                "identity": self._identity
             }
 
 def deploy():
-    vertexai.init(
-        project="linear-semantic-agents",
-        location="us-central1",
-        staging_bucket="gs://linear-semantic-agents-staging"
-    )
-    
-    remote_agent = reasoning_engines.ReasoningEngine.create(
-        DebugAgent(),
-        display_name="Debug Identity Agent",
-        requirements=["google-cloud-firestore", "google-auth"]
-    )
-    print(f"Deployed debug agent: {remote_agent.resource_name}")
+    """Deploy this variant through the shared deploy entry point."""
+    import deploy
+    deploy.main(["--variant", "debug"])
 
 if __name__ == "__main__":
     deploy()
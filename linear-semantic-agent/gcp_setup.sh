@@ -56,6 +56,15 @@ kubectl create namespace mapache --dry-run=client -o yaml | kubectl apply -f -
 echo -e "${YELLOW}Creating Firestore database...${NC}"
 gcloud firestore databases create --region=$REGION || true
 
+# Let Firestore delete expired cache entries (expires_at TTL field)
+echo -e "${YELLOW}Enabling Firestore TTL policies...${NC}"
+for COLLECTION in mapache_embeddings mapache_projects; do
+  gcloud firestore fields ttls update expires_at \
+    --collection-group=$COLLECTION \
+    --enable-ttl \
+    --async || true
+done
+
 # 7. Create secrets
 echo -e "${YELLOW}Creating Kubernetes secrets...${NC}"
 
@@ -3,23 +3,57 @@ Core agent logic using integrations and reasoning engine.
 Orchestrates tools, reasoning, and decision-making.
 """
 
-from typing import List, Optional
-from datetime import datetime
-import numpy as np
+import asyncio
+import time
+from typing import List, Optional, Set, Tuple
+from datetime import datetime, timezone
+from functools import partial
 
 from src.models.task import Task
 from src.models.project import LinearProject
-from src.models.decision import Decision
+from src.models.decision import Decision, DecisionType
 from src.integrations.linear_mcp import LinearMCPClient
 from src.integrations.vertex_ai import VertexAIClient, EmbeddingService
 from src.integrations.firestore_client import FirestoreClient
 from src.tools.reasoning import ReasoningEngine
+from src.cache.semantic_cache import SemanticCache
 from src.config.settings import settings
-from src.config.constants import CACHE_TTL_PROJECTS
-from src.utils.logger import get_logger
+from src.config.constants import (
+    CACHE_TTL_PROJECTS,
+    MIN_DESCRIPTION_LENGTH,
+    MAX_DESCRIPTION_LENGTH,
+    HEALTH_CACHE_TTL_SECONDS
+)
+from src.utils.similarity import QuantizedMatrix, stack_quantized_rows
+from src.utils.logger import get_logger, sample_exc_info
+from src.utils.ttl_cache import async_ttl_cache
 
 logger = get_logger(__name__)
 
+# Timezone-aware UTC clock; Firestore timestamps are UTC
+_now = partial(datetime.now, timezone.utc)
+
+# Precomputed decisions for descriptions rejected before any Vertex AI or
+# Firestore call. Shared across requests: treat as read-only.
+_TOO_SHORT_DECISION = Decision(
+    decision=DecisionType.CLARIFY,
+    confidence=0.0,
+    reasoning=f"Description too short (under {MIN_DESCRIPTION_LENGTH} characters)",
+    suggested_action="Add more detail about what needs to be done",
+    alignment_score=0.0,
+    tags=["invalid_input"],
+    clarification_questions=["What exactly needs to be done, and for which part of mapache.app?"]
+)
+_TOO_LONG_DECISION = Decision(
+    decision=DecisionType.CLARIFY,
+    confidence=0.0,
+    reasoning=f"Description too long (over {MAX_DESCRIPTION_LENGTH} characters)",
+    suggested_action="Summarize the task or split it into smaller tasks",
+    alignment_score=0.0,
+    tags=["invalid_input"],
+    clarification_questions=["Can this be summarized or split into smaller tasks?"]
+)
+
 
 class LinearSemanticAgent:
     """Linear Semantic Agent for task validation and categorization."""
@@ -44,7 +78,27 @@ class LinearSemanticAgent:
 
         # Cache
         self._projects_cache: Optional[List[LinearProject]] = None
-        self._cache_time: Optional[datetime] = None
+        self._cache_mono: Optional[float] = None  # time.monotonic() of last load
+        self._projects_version: Optional[datetime] = None  # Firestore meta updated_at
+
+        # Normalized, int8-quantized (N, D) embedding matrix for the cached
+        # projects, built lazily and invalidated whenever the cache or
+        # embeddings change
+        self._projects_matrix: Optional[QuantizedMatrix] = None
+        self._projects_indexed: List[LinearProject] = []
+
+        # Placeholder embedding for projects too short to embed meaningfully
+        self._empty_embedding: bytes = bytes(4 * settings.embeddings_dimension)  # float32 zeros
+        self._empty_embedding_int8: bytes = bytes(settings.embeddings_dimension)  # int8 zeros
+
+        # Decisions for repeated or paraphrased descriptions; cleared
+        # whenever the projects or their embeddings change
+        self.decision_cache = SemanticCache(settings.embeddings_dimension)
+
+        # Background writes (audit/cache) not awaited on the request path
+        self._pending_writes: Set[asyncio.Task] = set()
+        # Latest cache_projects write; embedding writes wait for it
+        self._projects_write: Optional[asyncio.Task] = None
 
         logger.info("Linear Semantic Agent initialized successfully")
 
@@ -62,7 +116,7 @@ class LinearSemanticAgent:
 
             # Update agent state
             await self.firestore_client.update_agent_state({
-                "last_init": datetime.now(),
+                "last_init": _now(),
                 "health_status": "healthy",
                 "version": settings.agent_version
             })
@@ -90,31 +144,33 @@ class LinearSemanticAgent:
             description_length=len(task.task_description)
         )
 
-        try:
-            # Step 1: Get or refresh projects cache
-            projects = await self.get_or_refresh_projects()
-
-            # Step 2: Generate task embedding
-            task_embedding = await self.embedding_service.embed_task(task.task_description)
-            logger.debug("Generated task embedding", dimension=len(task_embedding))
-
-            # Step 3: Generate project embeddings (if needed)
-            projects_with_embeddings = await self._ensure_project_embeddings(projects)
-
-            # Step 4: Use reasoning engine to evaluate
-            decision = await self.reasoning_engine.evaluate(
-                task=task,
-                task_embedding=task_embedding,
-                existing_projects=projects_with_embeddings
+        # Reject obviously invalid descriptions before any remote call
+        length = len(task.task_description.strip())
+        if length < MIN_DESCRIPTION_LENGTH or length > MAX_DESCRIPTION_LENGTH:
+            logger.info(
+                "Task description out of bounds, asking for clarification",
+                task_id=task.task_id,
+                description_length=length
             )
+            if length < MIN_DESCRIPTION_LENGTH:
+                return _TOO_SHORT_DECISION
+            return _TOO_LONG_DECISION
 
-            # Step 5: Store decision for audit
-            await self.firestore_client.store_decision(
+        try:
+            # Same description seen recently: reuse its decision outright
+            decision = self.decision_cache.get_exact(task.task_description)
+            if decision is not None:
+                logger.debug("Decision cache hit (exact)", task_id=task.task_id)
+            else:
+                decision = await self._evaluate_uncached(task)
+
+            # Step 5: Store decision for audit (in background)
+            self._spawn_write(self.firestore_client.store_decision(
                 decision=decision,
                 task_id=task.task_id,
                 task_description=task.task_description,
                 source=task.source
-            )
+            ))
 
             logger.info(
                 "Task evaluation complete",
@@ -130,11 +186,10 @@ class LinearSemanticAgent:
                 "Task evaluation failed",
                 task_id=task.task_id,
                 error=str(e),
-                exc_info=True
+                exc_info=sample_exc_info()
             )
 
             # Return error decision
-            from src.models.decision import DecisionType
             return Decision(
                 decision=DecisionType.CLARIFY,
                 confidence=0.0,
@@ -144,47 +199,115 @@ class LinearSemanticAgent:
                 tags=["error"]
             )
 
-    async def get_or_refresh_projects(self, force: bool = False) -> List[LinearProject]:
+    async def _evaluate_uncached(self, task: Task) -> Decision:
+        """Run the embedding and reasoning pipeline, consulting the semantic cache."""
+        # Steps 1-2: Get projects and generate task embedding concurrently
+        projects, task_embedding = await asyncio.gather(
+            self.get_or_refresh_projects(),
+            self.embedding_service.embed_task(task.task_description)
+        )
+        logger.debug("Generated task embedding", dimension=len(task_embedding))
+
+        # Step 3: Generate project embeddings (if needed)
+        await self._ensure_project_embeddings(projects)
+        indexed_projects, projects_matrix = self.get_projects_matrix()
+
+        # A paraphrase of a recent description gets the same decision
+        decision = self.decision_cache.get_similar(task_embedding)
+        if decision is not None:
+            logger.debug("Decision cache hit (semantic)", task_id=task.task_id)
+            return decision
+
+        # Step 4: Use reasoning engine to evaluate
+        decision = await self.reasoning_engine.evaluate(
+            task=task,
+            task_embedding=task_embedding,
+            existing_projects=indexed_projects,
+            projects_matrix=projects_matrix
+        )
+        self.decision_cache.put(task.task_description, task_embedding, decision)
+        return decision
+
+    def _spawn_write(self, coro) -> asyncio.Task:
+        """Run a write coroutine in the background and track it until done."""
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+        return task
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        """Untrack a finished background write and log any failure."""
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background write failed", error=str(task.exception()))
+
+    async def drain(self) -> None:
+        """Wait for all pending background writes to complete."""
+        if self._pending_writes:
+            logger.info("Draining background writes", count=len(self._pending_writes))
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        await self.embedding_service.drain()
+
+    async def get_or_refresh_projects(
+        self,
+        force: bool = False,
+        _ttl: int = CACHE_TTL_PROJECTS
+    ) -> List[LinearProject]:
         """
         Get projects from cache or refresh if expired.
 
         Args:
             force: Force refresh even if cache valid
+            _ttl: Cache TTL in seconds, bound at definition time (internal)
 
         Returns:
             List of Linear projects
         """
         # Check if cache is valid
-        if not force and self._projects_cache and self._cache_time:
-            age = (datetime.now() - self._cache_time).total_seconds()
-            if age < CACHE_TTL_PROJECTS:
+        if not force and self._projects_cache and self._cache_mono is not None:
+            if time.monotonic() - self._cache_mono < _ttl:
                 logger.debug("Using in-memory projects cache", count=len(self._projects_cache))
                 return self._projects_cache
 
         # Try Firestore cache
         if not force:
-            cached_projects = await self.firestore_client.get_cached_projects()
+            # Skip the full collection read if nothing was written since our load
+            version = await self.firestore_client.get_projects_version()
+            if (
+                self._projects_cache
+                and version is not None
+                and version == self._projects_version
+                and (_now() - version).total_seconds() < _ttl
+            ):
+                logger.debug("Firestore projects unchanged, reusing in-memory cache")
+                self._cache_mono = time.monotonic()
+                return self._projects_cache
+
+            cached_projects = await self.firestore_client.get_cached_projects(include_embedding=True)
             if cached_projects:
                 logger.info("Loaded projects from Firestore cache", count=len(cached_projects))
                 self._projects_cache = cached_projects
-                self._cache_time = datetime.now()
+                self._projects_version = version
+                self._cache_mono = time.monotonic()
+                self._invalidate_projects_matrix()
                 return cached_projects
 
         # Fetch from Linear
         logger.info("Fetching projects from Linear")
         projects = await self.linear_client.list_projects()
 
-        # Cache in Firestore
-        await self.firestore_client.cache_projects(projects)
+        # Cache in Firestore (in background; projects are already in memory)
+        self._projects_write = self._spawn_write(self.firestore_client.cache_projects(projects))
 
         # Update in-memory cache
         self._projects_cache = projects
-        self._cache_time = datetime.now()
+        self._cache_mono = time.monotonic()
+        self._invalidate_projects_matrix()
 
         # Update agent state
         await self.firestore_client.update_agent_state({
             "projects_count": len(projects),
-            "last_sync": datetime.now()
+            "last_sync": _now()
         })
 
         logger.info("Projects refreshed", count=len(projects))
@@ -204,7 +327,7 @@ class LinearSemanticAgent:
             Projects with embeddings
         """
         projects_needing_embeddings = [
-            p for p in projects if not p.embedding
+            p for p in projects if not p.has_embedding
         ]
 
         if not projects_needing_embeddings:
@@ -217,19 +340,68 @@ class LinearSemanticAgent:
             needed=len(projects_needing_embeddings)
         )
 
-        # Generate embeddings
+        # Projects with (almost) no text carry no signal; give them the
+        # zero placeholder (never matches) instead of a Vertex AI call
+        to_embed = []
         for project in projects_needing_embeddings:
-            embedding = await self.embedding_service.embed_project(
-                project.name,
-                project.description
+            text = project.name + (project.description or "")
+            if len(text.strip()) < MIN_DESCRIPTION_LENGTH:
+                project.embedding_bytes = self._empty_embedding
+                project.embedding_int8 = self._empty_embedding_int8
+                project.embedding_scale = 1.0
+            else:
+                to_embed.append(project)
+
+        # Generate embeddings in batched Vertex AI calls
+        if to_embed:
+            embeddings = await self.embedding_service.embed_project_batch(
+                [(p.name, p.description) for p in to_embed]
             )
-            project.embedding = embedding.tolist()
+            for project, embedding in zip(to_embed, embeddings):
+                project.set_embedding(embedding)
+        self._invalidate_projects_matrix()
 
-        # Update cache with embeddings
-        await self.firestore_client.cache_projects(projects_needing_embeddings)
+        # Update cache with embeddings (in background)
+        self._spawn_write(self._store_project_embeddings(projects_needing_embeddings))
 
         return projects
 
+    async def _store_project_embeddings(self, projects: List[LinearProject]) -> None:
+        """
+        Write back project embeddings once any pending cache_projects write
+        has landed, so its full-document set can't overwrite them.
+        """
+        if self._projects_write is not None and not self._projects_write.done():
+            await asyncio.wait([self._projects_write])
+        await self.firestore_client.store_project_embeddings(projects)
+
+    def _invalidate_projects_matrix(self) -> None:
+        """Drop the project matrix and the decisions made against it."""
+        self._projects_matrix = None
+        self.decision_cache.clear()
+
+    def get_projects_matrix(self) -> Tuple[List[LinearProject], Optional[QuantizedMatrix]]:
+        """
+        Get the quantized embedding matrix for the cached projects.
+
+        Rows come from each project's stored int8 embedding, so a refresh
+        only stacks bytes instead of re-normalizing and re-quantizing.
+
+        Returns:
+            Tuple of (projects with embeddings, int8 matrix whose row i is
+            the unit-length embedding of project i). The matrix is None when
+            no cached project has an embedding.
+        """
+        if self._projects_matrix is None:
+            indexed = [p for p in self._projects_cache or [] if p.has_embedding]
+            if indexed:
+                self._projects_matrix = stack_quantized_rows(
+                    [p.quantized_embedding() for p in indexed]
+                )
+            self._projects_indexed = indexed
+
+        return self._projects_indexed, self._projects_matrix
+
     async def create_issue_from_task(
         self,
         task: Task,
@@ -288,9 +460,11 @@ class LinearSemanticAgent:
 
         logger.info("Task linked to issue")
 
+    @async_ttl_cache(HEALTH_CACHE_TTL_SECONDS)
     async def get_agent_health(self) -> dict:
         """
-        Get agent health status.
+        Get agent health status, memoized briefly so probes and scrapes
+        don't each read Firestore.
 
         Returns:
             Health status dictionary
@@ -303,5 +477,5 @@ class LinearSemanticAgent:
             "last_init": state.get("last_init"),
             "last_sync": state.get("last_sync"),
             "projects_count": state.get("projects_count", 0),
-            "cache_valid": self._projects_cache is not None and self._cache_time is not None
+            "cache_valid": self._projects_cache is not None and self._cache_mono is not None
         }
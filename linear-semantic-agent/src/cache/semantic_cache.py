@@ -0,0 +1,148 @@
+"""
+In-process decision cache for repeated and paraphrased task descriptions.
+Exact matches are keyed by a hash of the description; near-duplicates are
+found by cosine similarity against the embeddings of recent descriptions.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from src.models.decision import Decision, DecisionType
+from src.utils.similarity import normalize
+from src.config.constants import (
+    CACHE_TTL_PROJECTS,
+    SEMANTIC_CACHE_SIZE,
+    SEMANTIC_CACHE_THRESHOLD
+)
+
+
+def _key(text: str) -> bytes:
+    """Hash a task description into an exact-match key."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class SemanticCache:
+    """
+    Bounded LRU of decisions, searchable by exact text or by embedding.
+
+    Embeddings live in one preallocated (capacity, D) matrix of unit-length
+    rows, so a semantic lookup is a single matrix-vector product. Entries
+    expire after ttl seconds; callers clear() the cache whenever the data
+    decisions depend on (the projects) changes.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        capacity: int = SEMANTIC_CACHE_SIZE,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = CACHE_TTL_PROJECTS
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            dimension: Embedding dimension
+            capacity: Maximum number of cached decisions
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Entry lifetime in seconds
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+
+        self._matrix = np.zeros((capacity, dimension), dtype=np.float32)
+        self._expires = np.zeros(capacity, dtype=np.float64)  # time.monotonic(); 0 = empty
+        self._decisions: list = [None] * capacity
+        self._slot_keys: list = [None] * capacity
+
+        # Exact-match key -> slot, in least-recently-used order
+        self._slots: "OrderedDict[bytes, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_exact(self, text: str) -> Optional[Decision]:
+        """
+        Get the cached decision for exactly this description.
+
+        Args:
+            text: Task description
+
+        Returns:
+            Cached decision, or None on miss or expiry
+        """
+        slot = self._slots.get(_key(text))
+        if slot is None:
+            return None
+        return self._hit(slot)
+
+    def get_similar(self, embedding: np.ndarray) -> Optional[Decision]:
+        """
+        Get the cached decision of the most similar previous description.
+
+        Args:
+            embedding: Task embedding
+
+        Returns:
+            Cached decision if the best live entry reaches the similarity
+            threshold, otherwise None
+        """
+        if not self._slots:
+            return None
+
+        scores = self._matrix @ normalize(embedding)
+        scores[self._expires <= time.monotonic()] = -1.0  # empty or expired
+        slot = int(np.argmax(scores))
+        if scores[slot] < self.threshold:
+            return None
+        return self._hit(slot)
+
+    def put(self, text: str, embedding: np.ndarray, decision: Decision) -> None:
+        """
+        Cache a decision, evicting the least recently used entry if full.
+
+        Clarify decisions are not cached: their questions and clarity
+        reasoning are built from this exact text, and get_similar would
+        serve them for paraphrases.
+
+        Args:
+            text: Task description
+            embedding: Task embedding
+            decision: Decision to cache (shared; treat as read-only)
+        """
+        if decision.decision == DecisionType.CLARIFY:
+            return
+
+        key = _key(text)
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+        elif len(self._slots) < len(self._decisions):
+            slot = len(self._slots)
+            self._slots[key] = slot
+        else:
+            _, slot = self._slots.popitem(last=False)
+            self._slots[key] = slot
+
+        self._matrix[slot] = normalize(embedding)
+        self._expires[slot] = time.monotonic() + self.ttl
+        self._decisions[slot] = decision
+        self._slot_keys[slot] = key
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._slots.clear()
+        self._expires[:] = 0.0
+        self._decisions = [None] * len(self._decisions)
+        self._slot_keys = [None] * len(self._slot_keys)
+
+    def _hit(self, slot: int) -> Optional[Decision]:
+        """Return a slot's decision and mark it recently used, unless expired."""
+        if self._expires[slot] <= time.monotonic():
+            return None
+        self._slots.move_to_end(self._slot_keys[slot])
+        return self._decisions[slot]
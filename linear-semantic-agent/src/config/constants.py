@@ -2,45 +2,70 @@
 Magic numbers, thresholds, and configuration constants.
 """
 
+from typing import Final, List
+
 # Similarity Thresholds
-SIMILARITY_THRESHOLD_MATCH = 0.75          # Consider as related project
-SIMILARITY_THRESHOLD_DUPLICATE = 0.80      # Suggest consolidation
-SIMILARITY_THRESHOLD_EXACT = 0.90          # Definitely a duplicate
+SIMILARITY_THRESHOLD_MATCH: Final[float] = 0.75         # Consider as related project
+SIMILARITY_THRESHOLD_DUPLICATE: Final[float] = 0.80     # Suggest consolidation
+SIMILARITY_THRESHOLD_EXACT: Final[float] = 0.90         # Definitely a duplicate
+SIMILARITY_OFFLOAD_MIN_SCORES: Final[int] = 200000      # Tasks x projects scored before matching leaves the event loop
+QUANTIZED_RESCORE_MARGIN: Final[float] = 0.02           # Int8 scores this close to a threshold are recomputed in float32
+QUANTIZED_BLOCK_ROWS: Final[int] = 256                  # Int8 rows widened per block (stays cache-resident)
 
 # Confidence Thresholds
-CONFIDENCE_MIN = 0.60                      # Minimum to make any decision
-CONFIDENCE_FILTER = 0.40                   # Below this → filter out
-CONFIDENCE_CONSOLIDATE = 0.75              # Above this → suggest consolidate
+CONFIDENCE_MIN: Final[float] = 0.60                     # Minimum to make any decision
+CONFIDENCE_FILTER: Final[float] = 0.40                  # Below this → filter out
+CONFIDENCE_CONSOLIDATE: Final[float] = 0.75             # Above this → suggest consolidate
 
 # Scoring Weights (must sum to 1.0)
-SCORE_WEIGHT_CONTEXT = 0.40                # Does it fit mapache domain?
-SCORE_WEIGHT_SIMILARITY = 0.30             # How similar to existing projects?
-SCORE_WEIGHT_CLARITY = 0.20                # How clear is the description?
-SCORE_WEIGHT_RED_FLAGS = 0.10              # Any red flags present?
+SCORE_WEIGHT_CONTEXT: Final[float] = 0.40               # Does it fit mapache domain?
+SCORE_WEIGHT_SIMILARITY: Final[float] = 0.30            # How similar to existing projects?
+SCORE_WEIGHT_CLARITY: Final[float] = 0.20               # How clear is the description?
+SCORE_WEIGHT_RED_FLAGS: Final[float] = 0.10             # Any red flags present?
 
 # Alignment Scoring
-ALIGNMENT_SCORE_MIN = 0.0                  # Not mapache work
-ALIGNMENT_SCORE_MAX = 1.0                  # Definitely mapache work
-ALIGNMENT_SCORE_THRESHOLD = 0.75           # Recommend "add" if >= this
+ALIGNMENT_SCORE_MIN: Final[float] = 0.0                 # Not mapache work
+ALIGNMENT_SCORE_MAX: Final[float] = 1.0                 # Definitely mapache work
+ALIGNMENT_SCORE_THRESHOLD: Final[float] = 0.75          # Recommend "add" if >= this
 
 # Caching
-CACHE_TTL_PROJECTS = 3600                  # 1 hour
-CACHE_TTL_EMBEDDINGS = 2592000             # 30 days
-CACHE_TTL_DECISIONS = 604800               # 7 days
+CACHE_TTL_PROJECTS: Final[int] = 3600                   # 1 hour
+CACHE_TTL_EMBEDDINGS: Final[int] = 2592000              # 30 days
+CACHE_TTL_DECISIONS: Final[int] = 604800                # 7 days
+CACHE_HASH_VERSION: Final[str] = "b3"                   # Embedding cache key scheme (BLAKE2b-160 of model|task|text)
+SEMANTIC_CACHE_SIZE: Final[int] = 1024                  # Decisions kept in the in-process cache
+SEMANTIC_CACHE_THRESHOLD: Final[float] = 0.95           # Cosine similarity to reuse a cached decision
+HEALTH_CACHE_TTL_SECONDS: Final[float] = 1.0            # Reuse agent health across /health and metrics reads
 
 # API Limits
-VERTEX_AI_BATCH_SIZE = 100                 # Max texts per embedding batch
-VERTEX_AI_QPM = 1000                       # Queries per minute limit
+VERTEX_AI_BATCH_SIZE: Final[int] = 100                  # Max texts per embedding batch
+VERTEX_AI_QPM: Final[int] = 1000                        # Queries per minute limit
+
+# Firestore
+FIRESTORE_BATCH_SIZE: Final[int] = 450                  # Writes per batch commit (max 500)
+FIRESTORE_PAGE_SIZE: Final[int] = 500                   # Documents per paged query
 
 # Linear MCP
-LINEAR_MAX_RETRIES = 3
-LINEAR_TIMEOUT_SECONDS = 30
-LINEAR_BATCH_SIZE = 50                     # Projects per API call
+LINEAR_MAX_RETRIES: Final[int] = 3
+LINEAR_TIMEOUT_SECONDS: Final[int] = 30
+LINEAR_CONNECT_TIMEOUT_SECONDS: Final[float] = 5.0     # Fail fast on unreachable endpoint
+LINEAR_KEEPALIVE_EXPIRY_SECONDS: Final[float] = 30.0    # Idle time before a pooled connection is dropped
+LINEAR_BATCH_SIZE: Final[int] = 50                      # Projects per API call
+
+# Reasoning Engine
+QUERY_TIMEOUT_SECONDS: Final[int] = 60                  # Max wait for one evaluate_task
+
+# API
+EVALUATE_QUEUE_TIMEOUT_SECONDS: Final[float] = 0.05     # Max wait for an evaluation slot before 429
+METRICS_REFRESH_SECONDS: Final[int] = 10                # Interval between metrics gauge updates
+
+# Logging
+LOG_TRACEBACK_SAMPLE_RATE: Final[float] = 0.05          # Share of request-path errors logged with a traceback
 
 # Text Processing
-MIN_DESCRIPTION_LENGTH = 10                # Characters
-MAX_DESCRIPTION_LENGTH = 5000              # Characters
-MIN_TITLE_LENGTH = 3                       # Characters
+MIN_DESCRIPTION_LENGTH: Final[int] = 10                 # Characters
+MAX_DESCRIPTION_LENGTH: Final[int] = 5000               # Characters
+MIN_TITLE_LENGTH: Final[int] = 3                        # Characters
 
 # Decision Rules
-DECISION_ENUM = ["add", "filter", "consolidate", "clarify"]
+DECISION_ENUM: Final[List[str]] = ["add", "filter", "consolidate", "clarify"]
@@ -2,7 +2,8 @@
 Environment configuration using Pydantic Settings.
 """
 
-from pydantic_settings import BaseSettings
+from dataclasses import make_dataclass
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -16,6 +17,7 @@ class Settings(BaseSettings):
     # Vertex AI Configuration
     vertex_ai_location: str = "us-central1"
     vertex_ai_model: str = "gemini-2.0-flash-exp"
+    vertex_ai_concurrency: int = 5  # Max concurrent embedding batches
 
     # Linear MCP Configuration
     linear_mcp_url: str = "https://mcp.linear.app/sse"
@@ -38,6 +40,7 @@ class Settings(BaseSettings):
     agent_version: str = "1.0.0"
     similarity_threshold: float = 0.75
     confidence_min_threshold: float = 0.60
+    agent_max_concurrency: int = 32  # Concurrent /evaluate-task requests per worker
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -48,11 +51,34 @@ class Settings(BaseSettings):
     debug: bool = False
     testing: bool = False
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False
+    )
+
+
+def freeze_settings(validated: Settings):
+    """
+    Snapshot validated settings into an immutable, slotted dataclass.
+
+    Settings are read-only after startup, so hot paths read plain slots
+    instead of going through the pydantic model.
+
+    Args:
+        validated: Validated Settings instance
+
+    Returns:
+        Frozen settings object with the same attribute names
+    """
+    frozen_cls = make_dataclass(
+        "FrozenSettings",
+        [(name, field.annotation) for name, field in Settings.model_fields.items()],
+        frozen=True,
+        slots=True
+    )
+    return frozen_cls(**validated.model_dump())
 
 
 # Global settings instance
-settings = Settings()
+settings = freeze_settings(Settings())
@@ -1,11 +1,18 @@
 """
 Firestore client for caching and state management.
 Stores projects, embeddings, decisions, and agent state.
+
+The SDK client is synchronous; every RPC runs through asyncio.to_thread
+so it doesn't block the event loop.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
+import asyncio
+import atexit
 import hashlib
+import threading
 import numpy as np
 from google.cloud import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
@@ -14,44 +21,121 @@ from src.config.settings import settings
 from src.config.constants import (
     CACHE_TTL_PROJECTS,
     CACHE_TTL_EMBEDDINGS,
-    CACHE_TTL_DECISIONS
+    CACHE_TTL_DECISIONS,
+    CACHE_HASH_VERSION,
+    FIRESTORE_BATCH_SIZE,
+    FIRESTORE_PAGE_SIZE
 )
 from src.models.project import LinearProject, LinearIssue
 from src.models.decision import Decision
+from src.utils.embedding_blob import EMBEDDING_DTYPE, decode_embedding, encode_embedding
 from src.utils.logger import get_logger
+from src.utils.text_processing import extract_keywords
 
 logger = get_logger(__name__)
 
+# Timezone-aware UTC clock; Firestore returns timestamps as aware UTC datetimes
+_now = partial(datetime.now, timezone.utc)
+
+# Project metadata fields; embedding and raw_data are fetched on request
+PROJECT_FIELDS = [
+    "id", "name", "description", "team", "status", "lead",
+    "created_at", "updated_at", "cached_at", "alignment_score", "domain"
+]
+PROJECT_EMBEDDING_FIELDS = [
+    "embedding", "embedding_bytes", "embedding_dtype", "embedding_int8", "embedding_scale"
+]
+
+# Fields returned by search_projects (skips embedding and raw_data)
+SEARCH_FIELDS = ["id", "name", "description", "team", "status", "alignment_score", "domain", "search_tokens"]
+
+# Max values in one Firestore array_contains_any filter
+SEARCH_MAX_QUERY_TOKENS = 10
+
+# Task type assumed when callers don't pass one (matches VertexAIClient)
+DEFAULT_TASK_TYPE = "SEMANTIC_SIMILARITY"
+
+
+@lru_cache(maxsize=4096)
+def _text_key(text: str, task_type: str) -> str:
+    """
+    Embedding cache document ID for a text.
+
+    Keyed on embedding model and task type as well as text: Vertex AI
+    returns different vectors per task type. The version prefix keeps keys
+    from older schemes from ever matching; those entries simply age out.
+    """
+    key = f"{settings.embeddings_model}|{task_type}|{text}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=20).hexdigest()
+    return f"{CACHE_HASH_VERSION}_{digest}"
+
+
+def _search_tokens(project: LinearProject) -> List[str]:
+    """Lowercased keywords of a project's name and description, for search."""
+    text = f"{project.name} {project.description or ''}"
+    return sorted(set(extract_keywords(text)))
+
+
+# Process-wide Firestore client: one gRPC channel and credential chain
+_CLIENT: Optional[firestore.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> firestore.Client:
+    """Create the shared Firestore client on first use and return it."""
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            import google.auth
+
+            # In Vertex AI Reasoning Engine, explicitly load credentials
+            try:
+                credentials, project_id = google.auth.default(
+                    scopes=['https://www.googleapis.com/auth/cloud-platform']
+                )
+                logger.info("Using ADC", project=project_id or settings.gcp_project_id)
+            except Exception as e:
+                logger.warning("ADC not available, using default", error=str(e))
+                credentials = None
+                project_id = None
+
+            # Handle default database explicitly
+            database_id = settings.firestore_database_id
+            if database_id == "(default)":
+                database_id = None
+
+            _CLIENT = firestore.Client(
+                project=project_id or settings.gcp_project_id,
+                database=database_id,
+                credentials=credentials
+            )
+            atexit.register(_close_client)
+
+    return _CLIENT
+
+
+def _close_client() -> None:
+    """Close the shared Firestore client at interpreter exit."""
+    global _CLIENT
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
+
 
 class FirestoreClient:
     """Client for Firestore operations."""
 
     def __init__(self):
-        """Initialize Firestore client."""
-        import os
-        import google.auth
-        
-        # In Vertex AI Reasoning Engine, explicitly load credentials
-        try:
-            credentials, project_id = google.auth.default(
-                scopes=['https://www.googleapis.com/auth/cloud-platform']
-            )
-            logger.info("Using ADC", project=project_id or settings.gcp_project_id)
-        except Exception as e:
-            logger.warning("ADC not available, using default", error=str(e))
-            credentials = None
-            project_id = None
-        
-        # Handle default database explicitly
-        database_id = settings.firestore_database_id
-        if database_id == "(default)":
-            database_id = None
-
-        self.db = firestore.Client(
-            project=project_id or settings.gcp_project_id,
-            database=database_id,
-            credentials=credentials
-        )
+        """
+        Initialize Firestore client.
+
+        Instances are cheap and may be created freely; they all share one
+        underlying firestore.Client (see _get_client).
+        """
+        self.db = _get_client()
         self.prefix = settings.firestore_collection_prefix
 
         # Collection references
@@ -59,6 +143,7 @@ class FirestoreClient:
         self.embeddings_col = self.db.collection(f"{self.prefix}embeddings")
         self.decisions_col = self.db.collection(f"{self.prefix}decisions")
         self.agent_state_col = self.db.collection(f"{self.prefix}agent_state")
+        self.meta_col = self.db.collection(f"{self.prefix}meta")
 
         logger.info("Firestore client initialized", project=self.db.project)
 
@@ -68,11 +153,18 @@ class FirestoreClient:
         """
         Cache Linear projects in Firestore.
 
+        Writes are committed in batches of FIRESTORE_BATCH_SIZE documents.
+        The projects metadata document is bumped in the final batch so
+        readers can detect changes without re-reading the collection.
+        Documents carry an expires_at field for the Firestore TTL policy.
+
         Args:
             projects: List of Linear projects to cache
         """
         batch = self.db.batch()
-        cached_at = datetime.now()
+        pending = 0
+        cached_at = _now()
+        expires_at = cached_at + timedelta(seconds=CACHE_TTL_PROJECTS)
 
         for project in projects:
             doc_ref = self.projects_col.document(project.id)
@@ -88,144 +180,364 @@ class FirestoreClient:
                 "created_at": project.created_at,
                 "updated_at": project.updated_at,
                 "cached_at": cached_at,
+                "expires_at": expires_at,  # Firestore TTL field
                 "embedding": project.embedding,
-                "raw_data": project.raw_data
+                "embedding_bytes": project.embedding_bytes,  # Stored as a Blob
+                "embedding_dtype": EMBEDDING_DTYPE,
+                "embedding_int8": project.embedding_int8,
+                "embedding_scale": project.embedding_scale,
+                "raw_data": project.raw_data,
+                "search_tokens": _search_tokens(project)
             }
 
             batch.set(doc_ref, data)
+            pending += 1
 
-        batch.commit()
+            if pending == FIRESTORE_BATCH_SIZE:
+                await asyncio.to_thread(batch.commit)
+                batch = self.db.batch()
+                pending = 0
+
+        batch.set(
+            self.meta_col.document("projects"),
+            {"updated_at": firestore.SERVER_TIMESTAMP, "count": len(projects)},
+            merge=True
+        )
+        await asyncio.to_thread(batch.commit)
         logger.info("Cached projects", count=len(projects))
 
-    async def get_cached_projects(self, max_age_seconds: int = CACHE_TTL_PROJECTS) -> List[LinearProject]:
+    async def get_projects_version(self) -> Optional[datetime]:
+        """
+        Get the last-modified time of the projects cache.
+
+        Reads a single metadata document instead of the projects collection.
+
+        Returns:
+            Server timestamp of the last cache_projects write, None if unknown
+        """
+        doc = await asyncio.to_thread(self.meta_col.document("projects").get)
+
+        if not doc.exists:
+            return None
+
+        return doc.to_dict().get("updated_at")
+
+    async def get_cached_projects(
+        self,
+        max_age_seconds: int = CACHE_TTL_PROJECTS,
+        include_embedding: bool = False,
+        include_raw: bool = False
+    ) -> List[LinearProject]:
         """
         Get cached projects if not expired.
 
+        Only metadata fields are downloaded by default; embeddings and
+        raw_data usually dominate document size.
+
         Args:
             max_age_seconds: Maximum age in seconds
+            include_embedding: Also fetch embedding fields
+            include_raw: Also fetch the raw Linear API response
 
         Returns:
             List of cached projects, empty if expired
         """
-        cutoff_time = datetime.now() - timedelta(seconds=max_age_seconds)
-
-        query = self.projects_col.where(
-            filter=FieldFilter("cached_at", ">=", cutoff_time)
-        )
-
-        docs = query.stream()
-        projects = []
-
-        for doc in docs:
-            data = doc.to_dict()
-            project = LinearProject(
-                id=data["id"],
-                name=data["name"],
-                description=data.get("description"),
-                team=data.get("team"),
-                status=data.get("status"),
-                lead=data.get("lead"),
-                created_at=data.get("created_at"),
-                updated_at=data.get("updated_at"),
-                cached_at=data.get("cached_at"),
-                embedding=data.get("embedding"),
-                alignment_score=data.get("alignment_score"),
-                domain=data.get("domain"),
-                raw_data=data.get("raw_data", {})
+        projects = [
+            project
+            async for project in self.iter_cached_projects(
+                max_age_seconds, include_embedding, include_raw
             )
-            projects.append(project)
+        ]
 
         logger.info("Retrieved cached projects", count=len(projects))
         return projects
 
-    async def get_project_by_id(self, project_id: str) -> Optional[LinearProject]:
+    async def iter_cached_projects(
+        self,
+        max_age_seconds: int = CACHE_TTL_PROJECTS,
+        include_embedding: bool = False,
+        include_raw: bool = False
+    ) -> AsyncIterator[LinearProject]:
         """
-        Get project by ID from cache.
+        Iterate cached projects page by page.
+
+        Holds at most FIRESTORE_PAGE_SIZE documents at a time, and callers
+        can stop early without reading the rest of the collection.
 
         Args:
-            project_id: Linear project ID
+            max_age_seconds: Maximum age in seconds
+            include_embedding: Also fetch embedding fields
+            include_raw: Also fetch the raw Linear API response
 
-        Returns:
-            Project if found, None otherwise
+        Yields:
+            Cached projects not older than max_age_seconds
         """
-        doc = self.projects_col.document(project_id).get()
+        cutoff_time = _now() - timedelta(seconds=max_age_seconds)
+
+        fields = list(PROJECT_FIELDS)
+        if include_embedding:
+            fields += PROJECT_EMBEDDING_FIELDS
+        if include_raw:
+            fields.append("raw_data")
+
+        query = (
+            self.projects_col
+            .where(filter=FieldFilter("cached_at", ">=", cutoff_time))
+            .select(fields)
+            .order_by("cached_at")
+            .limit(FIRESTORE_PAGE_SIZE)
+        )
 
-        if not doc.exists:
-            return None
+        last_doc = None
+        while True:
+            page_query = query.start_after(last_doc) if last_doc is not None else query
+            docs = await asyncio.to_thread(lambda: list(page_query.stream()))
+
+            for doc in docs:
+                yield self._project_from_doc(doc.to_dict())
 
-        data = doc.to_dict()
+            if len(docs) < FIRESTORE_PAGE_SIZE:
+                return
+            last_doc = docs[-1]
+
+    async def store_project_embeddings(self, projects: List[LinearProject]) -> None:
+        """
+        Write back embeddings for already-cached projects.
+
+        Only the embedding fields are updated, so documents loaded without
+        raw_data keep their stored copy. Documents that no longer exist
+        (failed cache write, TTL deletion) fail the batch rather than being
+        recreated without id or name. The projects metadata document is
+        bumped so other instances pick up the embeddings.
+
+        Args:
+            projects: Projects whose embeddings changed
+        """
+        for start in range(0, len(projects), FIRESTORE_BATCH_SIZE):
+            batch = self.db.batch()
+            for project in projects[start:start + FIRESTORE_BATCH_SIZE]:
+                batch.update(
+                    self.projects_col.document(project.id),
+                    {
+                        "embedding": project.embedding,
+                        "embedding_bytes": project.embedding_bytes,
+                        "embedding_dtype": EMBEDDING_DTYPE,
+                        "embedding_int8": project.embedding_int8,
+                        "embedding_scale": project.embedding_scale
+                    }
+                )
+            if start + FIRESTORE_BATCH_SIZE >= len(projects):
+                batch.set(
+                    self.meta_col.document("projects"),
+                    {"updated_at": firestore.SERVER_TIMESTAMP},
+                    merge=True
+                )
+            await asyncio.to_thread(batch.commit)
+
+        logger.info("Stored project embeddings", count=len(projects))
+
+    @staticmethod
+    def _project_from_doc(data: Dict[str, Any]) -> LinearProject:
+        """
+        Build a project from a (possibly partial) cached document.
+
+        embedding_bytes written before blobs carried embedding_dtype were
+        native-endian; they are dropped so the embedding is regenerated.
+        """
+        embedding_bytes = data.get("embedding_bytes")
+        if data.get("embedding_dtype") != EMBEDDING_DTYPE:
+            embedding_bytes = None
         return LinearProject(
             id=data["id"],
             name=data["name"],
             description=data.get("description"),
             team=data.get("team"),
             status=data.get("status"),
+            lead=data.get("lead"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            cached_at=data.get("cached_at"),
             embedding=data.get("embedding"),
+            embedding_bytes=embedding_bytes,
+            embedding_int8=data.get("embedding_int8"),
+            embedding_scale=data.get("embedding_scale"),
             alignment_score=data.get("alignment_score"),
             domain=data.get("domain"),
             raw_data=data.get("raw_data", {})
         )
 
+    async def get_project_by_id(
+        self,
+        project_id: str,
+        projection: Optional[Tuple[str, ...]] = None
+    ) -> Optional[LinearProject]:
+        """
+        Get project by ID from cache.
+
+        Args:
+            project_id: Linear project ID
+            projection: Fields to fetch (e.g. PROJECT_FIELDS); the whole
+                document, including embedding and raw_data, if None
+
+        Returns:
+            Project if found, None otherwise
+        """
+        doc_ref = self.projects_col.document(project_id)
+        if projection is None:
+            doc = await asyncio.to_thread(doc_ref.get)
+        else:
+            # id and name are required to build the model
+            field_paths = list(dict.fromkeys(("id", "name") + tuple(projection)))
+            doc = await asyncio.to_thread(doc_ref.get, field_paths=field_paths)
+
+        if not doc.exists:
+            return None
+
+        return self._project_from_doc(doc.to_dict())
+
     # --- Embeddings Cache ---
 
-    def _hash_text(self, text: str) -> str:
+    def _hash_text(self, text: str, task_type: str = DEFAULT_TASK_TYPE) -> str:
         """Generate hash for text."""
-        return hashlib.sha256(text.encode()).hexdigest()
-
-    async def store_embedding(self, text: str, embedding: np.ndarray) -> None:
+        return _text_key(text, task_type)
+
+    async def store_embedding(
+        self,
+        text: str,
+        embedding: np.ndarray,
+        task_type: str = DEFAULT_TASK_TYPE
+    ) -> None:
         """
         Store text embedding in cache.
 
         Args:
             text: Original text
             embedding: Embedding vector
+            task_type: Vertex AI task type the embedding was generated for
         """
-        text_hash = self._hash_text(text)
+        text_hash = self._hash_text(text, task_type)
         doc_ref = self.embeddings_col.document(text_hash)
 
-        data = {
+        await asyncio.to_thread(doc_ref.set, self._embedding_doc(text, embedding, task_type, _now()))
+        logger.debug("Stored embedding", text_hash=text_hash)
+
+    async def store_embeddings_batch(
+        self,
+        items: List[Tuple[str, np.ndarray]],
+        task_type: str = DEFAULT_TASK_TYPE
+    ) -> None:
+        """
+        Store multiple text embeddings in cache.
+
+        Writes are committed in batches of FIRESTORE_BATCH_SIZE documents,
+        off the event loop.
+
+        Args:
+            items: List of (text, embedding) pairs
+            task_type: Vertex AI task type the embeddings were generated for
+        """
+        created_at = _now()
+
+        for start in range(0, len(items), FIRESTORE_BATCH_SIZE):
+            batch = self.db.batch()
+            for text, embedding in items[start:start + FIRESTORE_BATCH_SIZE]:
+                doc_ref = self.embeddings_col.document(self._hash_text(text, task_type))
+                batch.set(doc_ref, self._embedding_doc(text, embedding, task_type, created_at))
+            await asyncio.to_thread(batch.commit)
+
+        logger.debug("Stored embeddings", count=len(items))
+
+    @staticmethod
+    def _embedding_doc(
+        text: str,
+        embedding: np.ndarray,
+        task_type: str,
+        created_at: datetime
+    ) -> Dict[str, Any]:
+        """Build the cache document for a text embedding."""
+        return {
             "text": text,
-            "embedding": embedding.tolist(),
+            "task_type": task_type,
+            "embedding": encode_embedding(embedding),
+            "embedding_dtype": EMBEDDING_DTYPE,
             "dimension": len(embedding),
             "model": settings.embeddings_model,
-            "created_at": datetime.now(),
-            "ttl_seconds": CACHE_TTL_EMBEDDINGS
+            "created_at": created_at,
+            "expires_at": created_at + timedelta(seconds=CACHE_TTL_EMBEDDINGS)  # Firestore TTL field
         }
 
-        doc_ref.set(data)
-        logger.debug("Stored embedding", text_hash=text_hash)
-
-    async def get_embedding(self, text: str) -> Optional[np.ndarray]:
+    async def get_embedding(self, text: str, task_type: str = DEFAULT_TASK_TYPE) -> Optional[np.ndarray]:
         """
         Get cached embedding for text.
 
         Args:
             text: Original text
+            task_type: Vertex AI task type
 
         Returns:
             Embedding vector if found, None otherwise
         """
-        text_hash = self._hash_text(text)
-        doc = self.embeddings_col.document(text_hash).get()
+        text_hash = self._hash_text(text, task_type)
+        doc = await asyncio.to_thread(self.embeddings_col.document(text_hash).get)
 
         if not doc.exists:
             return None
 
-        data = doc.to_dict()
+        return self._embedding_from_doc(doc.to_dict(), _now())
 
-        # Check TTL
-        created_at = data.get("created_at")
-        ttl_seconds = data.get("ttl_seconds", CACHE_TTL_EMBEDDINGS)
+    async def get_embeddings_bulk(
+        self,
+        texts: List[str],
+        task_type: str = DEFAULT_TASK_TYPE
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Get cached embeddings for multiple texts in a single batched read.
 
-        if created_at:
-            age = (datetime.now() - created_at).total_seconds()
-            if age > ttl_seconds:
-                # Expired
-                return None
+        Args:
+            texts: Original texts
+            task_type: Vertex AI task type
+
+        Returns:
+            Embedding vectors aligned with texts, None where missing or expired
+        """
+        if not texts:
+            return []
+
+        hashes = [self._hash_text(text, task_type) for text in texts]
+        refs = [self.embeddings_col.document(text_hash) for text_hash in dict.fromkeys(hashes)]
+        snapshots = await asyncio.to_thread(lambda: list(self.db.get_all(refs)))
+
+        # get_all doesn't preserve request order
+        now = _now()
+        found = {
+            snapshot.id: self._embedding_from_doc(snapshot.to_dict(), now)
+            for snapshot in snapshots
+            if snapshot.exists
+        }
+        return [found.get(text_hash) for text_hash in hashes]
+
+    @staticmethod
+    def _embedding_from_doc(data: Dict[str, Any], now: datetime) -> Optional[np.ndarray]:
+        """
+        Decode a cached embedding document, None if expired or empty.
+
+        Blobs written before they carried embedding_dtype are dropped so
+        the embedding is regenerated, as for project documents.
+        """
+        # The Firestore TTL policy on expires_at deletes expired entries,
+        # but only eventually; skip ones not yet purged
+        expires_at = data.get("expires_at")
+        if expires_at is not None and expires_at <= now:
+            return None
 
-        embedding_list = data.get("embedding")
-        if embedding_list:
-            return np.array(embedding_list)
+        embedding = data.get("embedding")
+        if isinstance(embedding, bytes):
+            if data.get("embedding_dtype") != EMBEDDING_DTYPE:
+                return None
+            return decode_embedding(embedding)
+        if embedding:
+            # Entries written before blobs were used hold a list of floats
+            return np.asarray(embedding, dtype=np.float32)
 
         return None
 
@@ -254,10 +566,10 @@ class FirestoreClient:
             "consolidate_with": decision.consolidate_with,
             "alignment_score": decision.alignment_score,
             "tags": decision.tags,
-            "created_at": datetime.now()
+            "created_at": _now()
         }
 
-        doc_ref.set(data)
+        await asyncio.to_thread(doc_ref.set, data)
         logger.info("Stored decision", task_id=task_id, decision=decision.decision.value)
 
     # --- Agent State ---
@@ -271,8 +583,8 @@ class FirestoreClient:
         """
         doc_ref = self.agent_state_col.document("current")
 
-        state["last_updated"] = datetime.now()
-        doc_ref.set(state, merge=True)
+        state["last_updated"] = _now()
+        await asyncio.to_thread(doc_ref.set, state, merge=True)
 
         logger.debug("Updated agent state", keys=list(state.keys()))
 
@@ -283,7 +595,7 @@ class FirestoreClient:
         Returns:
             State dictionary
         """
-        doc = self.agent_state_col.document("current").get()
+        doc = await asyncio.to_thread(self.agent_state_col.document("current").get)
 
         if doc.exists:
             return doc.to_dict()
@@ -294,7 +606,11 @@ class FirestoreClient:
 
     async def search_projects(self, query: str, limit: int = 10) -> List[LinearProject]:
         """
-        Search projects by query string (basic text match).
+        Search projects by query keywords.
+
+        Matches against the search_tokens array written by cache_projects,
+        so Firestore filters server-side and returns slim documents
+        (no embedding or raw_data). All query keywords must match.
 
         Args:
             query: Search query
@@ -305,32 +621,47 @@ class FirestoreClient:
         """
         # Note: This is a basic implementation
         # For production, use Vertex AI Search or full-text search
-        query_lower = query.lower()
+        tokens = list(dict.fromkeys(extract_keywords(query)))
+        if not tokens:
+            return []
+
+        if len(tokens) == 1:
+            token_filter = FieldFilter("search_tokens", "array_contains", tokens[0])
+            max_docs = limit
+        else:
+            # Fetch candidates matching any keyword, intersect client-side
+            token_filter = FieldFilter("search_tokens", "array_contains_any", tokens[:SEARCH_MAX_QUERY_TOKENS])
+            max_docs = 100
+
+        docs_query = (
+            self.projects_col
+            .where(filter=token_filter)
+            .select(SEARCH_FIELDS)
+            .limit(max_docs)
+        )
+        docs = await asyncio.to_thread(lambda: list(docs_query.stream()))
 
-        all_docs = self.projects_col.limit(100).stream()
+        required = set(tokens)
         matches = []
 
-        for doc in all_docs:
+        for doc in docs:
             data = doc.to_dict()
-            name = data.get("name", "").lower()
-            description = data.get("description", "").lower()
-
-            if query_lower in name or query_lower in description:
-                project = LinearProject(
-                    id=data["id"],
-                    name=data["name"],
-                    description=data.get("description"),
-                    team=data.get("team"),
-                    status=data.get("status"),
-                    embedding=data.get("embedding"),
-                    alignment_score=data.get("alignment_score"),
-                    domain=data.get("domain"),
-                    raw_data=data.get("raw_data", {})
-                )
-                matches.append(project)
+            if not required.issubset(data.get("search_tokens", ())):
+                continue
+
+            project = LinearProject(
+                id=data["id"],
+                name=data["name"],
+                description=data.get("description"),
+                team=data.get("team"),
+                status=data.get("status"),
+                alignment_score=data.get("alignment_score"),
+                domain=data.get("domain")
+            )
+            matches.append(project)
 
-                if len(matches) >= limit:
-                    break
+            if len(matches) >= limit:
+                break
 
         logger.info("Search results", query=query, count=len(matches))
         return matches
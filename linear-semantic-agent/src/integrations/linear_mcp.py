@@ -6,16 +6,38 @@ Implements authenticated access to Linear API.
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config.settings import settings
-from src.config.constants import LINEAR_MAX_RETRIES, LINEAR_TIMEOUT_SECONDS
+from src.config.constants import (
+    LINEAR_MAX_RETRIES,
+    LINEAR_TIMEOUT_SECONDS,
+    LINEAR_CONNECT_TIMEOUT_SECONDS,
+    LINEAR_KEEPALIVE_EXPIRY_SECONDS
+)
 from src.models.project import LinearProject, LinearIssue
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, sample_exc_info
 
 logger = get_logger(__name__)
 
 
+def _parse_dt(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 datetime string from the Linear API.
+
+    datetime.fromisoformat is implemented in C and accepts a trailing 'Z'
+    natively on Python 3.11+.
+    """
+    if not date_str:
+        return None
+
+    try:
+        return datetime.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
 class LinearMCPError(Exception):
     """Base exception for Linear MCP errors."""
     pass
@@ -48,8 +70,26 @@ class LinearMCPClient:
             "Content-Type": "application/json"
         }
 
+        # One pooled client for all requests: keeps connections alive
+        # instead of a new TCP+TLS handshake per call. Idle connections are
+        # kept well past httpx's 5s default, since requests arrive sparsely
+        self._http = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=httpx.Timeout(LINEAR_TIMEOUT_SECONDS, connect=LINEAR_CONNECT_TIMEOUT_SECONDS),
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=LINEAR_KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+
         logger.info("Linear MCP client initialized")
 
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        await self._http.aclose()
+
     @retry(
         stop=stop_after_attempt(LINEAR_MAX_RETRIES),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -77,18 +117,19 @@ class LinearMCPClient:
         url = f"{self.mcp_url}/{endpoint.lstrip('/')}"
 
         try:
-            async with httpx.AsyncClient(timeout=LINEAR_TIMEOUT_SECONDS) as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=self.headers, params=data)
-                elif method.upper() == "POST":
-                    response = await client.post(url, headers=self.headers, json=data)
-                elif method.upper() == "PUT":
-                    response = await client.put(url, headers=self.headers, json=data)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-
-                response.raise_for_status()
-                return response.json()
+            # Bodies are encoded/decoded with orjson rather than stdlib json
+            body = orjson.dumps(data) if data is not None else None
+            if method.upper() == "GET":
+                response = await self._http.get(url, params=data)
+            elif method.upper() == "POST":
+                response = await self._http.post(url, content=body)
+            elif method.upper() == "PUT":
+                response = await self._http.put(url, content=body)
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -96,7 +137,7 @@ class LinearMCPClient:
             else:
                 raise LinearAPIError(f"API error: {e}")
         except Exception as e:
-            logger.error("Request failed", error=str(e), exc_info=True)
+            logger.error("Request failed", error=str(e), exc_info=sample_exc_info())
             raise LinearAPIError(f"Request failed: {e}")
 
     async def list_projects(self) -> List[LinearProject]:
@@ -122,8 +163,8 @@ class LinearMCPClient:
                     team=item.get("team", {}).get("name"),
                     status=item.get("state"),
                     lead=item.get("lead"),
-                    created_at=self._parse_datetime(item.get("createdAt")),
-                    updated_at=self._parse_datetime(item.get("updatedAt")),
+                    created_at=_parse_dt(item.get("createdAt")),
+                    updated_at=_parse_dt(item.get("updatedAt")),
                     raw_data=item
                 )
                 projects.append(project)
@@ -132,7 +173,7 @@ class LinearMCPClient:
             return projects
 
         except Exception as e:
-            logger.error("Failed to fetch projects", error=str(e), exc_info=True)
+            logger.error("Failed to fetch projects", error=str(e), exc_info=sample_exc_info())
             raise
 
     async def get_project(self, project_id: str) -> LinearProject:
@@ -157,8 +198,8 @@ class LinearMCPClient:
             team=item.get("team", {}).get("name"),
             status=item.get("state"),
             lead=item.get("lead"),
-            created_at=self._parse_datetime(item.get("createdAt")),
-            updated_at=self._parse_datetime(item.get("updatedAt")),
+            created_at=_parse_dt(item.get("createdAt")),
+            updated_at=_parse_dt(item.get("updatedAt")),
             raw_data=item
         )
 
@@ -191,8 +232,8 @@ class LinearMCPClient:
                 status=item.get("state", {}).get("name"),
                 project_id=item.get("project", {}).get("id"),
                 priority=item.get("priority"),
-                created_at=self._parse_datetime(item.get("createdAt")),
-                updated_at=self._parse_datetime(item.get("updatedAt")),
+                created_at=_parse_dt(item.get("createdAt")),
+                updated_at=_parse_dt(item.get("updatedAt")),
                 raw_data=item
             )
             issues.append(issue)
@@ -223,8 +264,8 @@ class LinearMCPClient:
                 status=item.get("state", {}).get("name"),
                 project_id=item.get("project", {}).get("id"),
                 priority=item.get("priority"),
-                created_at=self._parse_datetime(item.get("createdAt")),
-                updated_at=self._parse_datetime(item.get("updatedAt")),
+                created_at=_parse_dt(item.get("createdAt")),
+                updated_at=_parse_dt(item.get("updatedAt")),
                 raw_data=item
             )
             issues.append(issue)
@@ -254,8 +295,8 @@ class LinearMCPClient:
             status=item.get("state", {}).get("name"),
             project_id=item.get("project", {}).get("id"),
             priority=item.get("priority"),
-            created_at=self._parse_datetime(item.get("createdAt")),
-            updated_at=self._parse_datetime(item.get("updatedAt")),
+            created_at=_parse_dt(item.get("createdAt")),
+            updated_at=_parse_dt(item.get("updatedAt")),
             raw_data=item
         )
 
@@ -340,14 +381,3 @@ class LinearMCPClient:
         await self._make_request("POST", "/issue-relations", data=data)
 
         logger.info("Linked issues")
-
-    @staticmethod
-    def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-        """Parse datetime string."""
-        if not date_str:
-            return None
-
-        try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except Exception:
-            return None
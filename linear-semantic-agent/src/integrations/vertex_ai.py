@@ -2,7 +2,9 @@
 Vertex AI integration for embeddings and LLM calls.
 """
 
-from typing import List, Optional
+import asyncio
+import sys
+from typing import Dict, List, Optional, Set, Tuple
 import numpy as np
 from google.cloud import aiplatform
 from vertexai.language_models import TextEmbeddingModel, TextEmbeddingInput
@@ -10,10 +12,40 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config.settings import settings
 from src.config.constants import VERTEX_AI_BATCH_SIZE
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, sample_exc_info
 
 logger = get_logger(__name__)
 
+# Interned Vertex AI task types, so per-input objects share one string
+_TASK_TYPES = {
+    task_type: sys.intern(task_type)
+    for task_type in (
+        "SEMANTIC_SIMILARITY",
+        "RETRIEVAL_DOCUMENT",
+        "RETRIEVAL_QUERY",
+        "CLASSIFICATION",
+        "CLUSTERING",
+    )
+}
+
+# Shared read-only zero vector returned for empty texts
+_ZERO: Optional[np.ndarray] = None
+
+
+def _zero() -> np.ndarray:
+    """
+    Get the zero embedding, created on first use.
+
+    The array is shared and read-only; callers that need to modify it
+    must copy it first.
+    """
+    global _ZERO
+    if _ZERO is None:
+        zero = np.zeros(settings.embeddings_dimension, dtype=np.float32)
+        zero.flags.writeable = False
+        _ZERO = zero
+    return _ZERO
+
 
 class VertexAIClient:
     """Client for Vertex AI embeddings and models."""
@@ -26,6 +58,9 @@ class VertexAIClient:
         )
 
         self.embedding_model = TextEmbeddingModel.from_pretrained(settings.embeddings_model)
+
+        # Caps in-flight embedding batches to respect Vertex AI quotas
+        self._batch_semaphore = asyncio.Semaphore(settings.vertex_ai_concurrency)
         logger.info(
             "Vertex AI client initialized",
             project=settings.gcp_project_id,
@@ -53,25 +88,24 @@ class VertexAIClient:
         """
         if not text or not text.strip():
             logger.warning("Empty text provided for embedding")
-            return np.zeros(settings.embeddings_dimension)
+            return _zero()
 
         try:
             # Create input with task type
             embedding_input = TextEmbeddingInput(
                 text=text,
-                task_type=task_type
+                task_type=_TASK_TYPES.get(task_type, task_type)
             )
 
-            # Get embeddings
-            embeddings = self.embedding_model.get_embeddings([embedding_input])
+            # Get embeddings (blocking SDK call, run off the event loop)
+            embeddings = await asyncio.to_thread(self.embedding_model.get_embeddings, [embedding_input])
 
             if not embeddings or len(embeddings) == 0:
                 logger.error("No embeddings returned")
-                return np.zeros(settings.embeddings_dimension)
+                return _zero()
 
             # Convert to numpy array
-            embedding_values = embeddings[0].values
-            embedding_array = np.array(embedding_values)
+            embedding_array = np.asarray(embeddings[0].values, dtype=np.float32)
 
             logger.debug(
                 "Generated embedding",
@@ -83,7 +117,7 @@ class VertexAIClient:
             return embedding_array
 
         except Exception as e:
-            logger.error("Error generating embedding", error=str(e), exc_info=True)
+            logger.error("Error generating embedding", error=str(e), exc_info=sample_exc_info())
             raise
 
     @retry(
@@ -108,47 +142,58 @@ class VertexAIClient:
         if not texts:
             return []
 
-        # Remove empty texts
-        valid_texts = [t for t in texts if t and t.strip()]
+        # Skip empty texts; they keep the shared zero vector in the output
+        valid_indices = [i for i, t in enumerate(texts) if t and t.strip()]
+        valid_texts = [texts[i] for i in valid_indices]
 
         if not valid_texts:
             logger.warning("No valid texts for batch embedding")
-            return [np.zeros(settings.embeddings_dimension) for _ in texts]
+            return [_zero()] * len(texts)
 
         try:
-            # Process in batches
-            all_embeddings = []
+            # Dispatch batches concurrently, bounded by the shared semaphore
+            batches = [
+                valid_texts[i:i + VERTEX_AI_BATCH_SIZE]
+                for i in range(0, len(valid_texts), VERTEX_AI_BATCH_SIZE)
+            ]
+            results = await asyncio.gather(
+                *(self._embed_batch(batch, task_type) for batch in batches)
+            )
 
-            for i in range(0, len(valid_texts), VERTEX_AI_BATCH_SIZE):
-                batch = valid_texts[i:i + VERTEX_AI_BATCH_SIZE]
+            all_embeddings = [_zero()] * len(texts)
+            rows = (row for batch_array in results for row in batch_array)
+            for i, row in zip(valid_indices, rows):
+                all_embeddings[i] = row
 
-                # Create inputs with task type
-                embedding_inputs = [
-                    TextEmbeddingInput(text=text, task_type=task_type)
-                    for text in batch
-                ]
+            return all_embeddings
 
-                # Get embeddings
-                embeddings = self.embedding_model.get_embeddings(embedding_inputs)
+        except Exception as e:
+            logger.error("Error generating batch embeddings", error=str(e), exc_info=sample_exc_info())
+            raise
 
-                # Convert to numpy arrays
-                batch_arrays = [
-                    np.array(emb.values) for emb in embeddings
-                ]
+    async def _embed_batch(self, batch: List[str], task_type: str) -> np.ndarray:
+        """
+        Embed one batch of at most VERTEX_AI_BATCH_SIZE texts.
 
-                all_embeddings.extend(batch_arrays)
+        Returns:
+            (len(batch), D) float32 array; rows are views into one buffer
+        """
+        # Create inputs with task type (resolved once per batch)
+        task_type = _TASK_TYPES.get(task_type, task_type)
+        embedding_inputs = [
+            TextEmbeddingInput(text=text, task_type=task_type)
+            for text in batch
+        ]
 
-                logger.debug(
-                    "Generated batch embeddings",
-                    batch_size=len(batch),
-                    total=len(all_embeddings)
-                )
+        # Get embeddings (blocking SDK call, run off the event loop)
+        async with self._batch_semaphore:
+            embeddings = await asyncio.to_thread(self.embedding_model.get_embeddings, embedding_inputs)
 
-            return all_embeddings
+        # Convert in one pass; rows are views into one contiguous buffer
+        batch_array = np.asarray([emb.values for emb in embeddings], dtype=np.float32)
 
-        except Exception as e:
-            logger.error("Error generating batch embeddings", error=str(e), exc_info=True)
-            raise
+        logger.debug("Generated batch embeddings", batch_size=len(batch))
+        return batch_array
 
 
 class EmbeddingService:
@@ -164,8 +209,30 @@ class EmbeddingService:
         """
         self.vertex_client = vertex_client
         self.firestore_client = firestore_client
+
+        # Cache writes run off the request path; tracked so shutdown can drain
+        self._pending_writes: Set[asyncio.Task] = set()
+
         logger.info("Embedding service initialized")
 
+    def _spawn_write(self, coro) -> None:
+        """Run a cache write coroutine in the background and track it until done."""
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        """Untrack a finished cache write and log any failure."""
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Embedding cache write failed", error=str(task.exception()))
+
+    async def drain(self) -> None:
+        """Wait for all pending cache writes to complete."""
+        if self._pending_writes:
+            logger.info("Draining embedding cache writes", count=len(self._pending_writes))
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
     async def get_embedding(
         self,
         text: str,
@@ -185,7 +252,7 @@ class EmbeddingService:
         """
         # Check cache first
         if use_cache:
-            cached = await self.firestore_client.get_embedding(text)
+            cached = await self.firestore_client.get_embedding(text, task_type)
             if cached is not None:
                 logger.debug("Using cached embedding", text_length=len(text))
                 return cached
@@ -193,9 +260,9 @@ class EmbeddingService:
         # Generate new embedding
         embedding = await self.vertex_client.embed_text(text, task_type)
 
-        # Store in cache
+        # Store in cache (in background)
         if use_cache:
-            await self.firestore_client.store_embedding(text, embedding)
+            self._spawn_write(self.firestore_client.store_embedding(text, embedding, task_type))
 
         return embedding
 
@@ -216,41 +283,41 @@ class EmbeddingService:
         Returns:
             List of embedding vectors
         """
-        embeddings = []
-        texts_to_embed = []
-        cache_indices = []
-
-        # Check cache for each text
-        for i, text in enumerate(texts):
-            if use_cache:
-                cached = await self.firestore_client.get_embedding(text)
-                if cached is not None:
-                    embeddings.append(cached)
-                    continue
+        # Check cache for all texts in one batched read
+        if use_cache:
+            embeddings = await self.firestore_client.get_embeddings_bulk(texts, task_type)
+        else:
+            embeddings = [None] * len(texts)
 
-            # Need to generate
-            texts_to_embed.append(text)
-            cache_indices.append(i)
-            embeddings.append(None)  # Placeholder
+        # Group missing texts so each distinct string is embedded once
+        missing: Dict[str, List[int]] = {}
+        for i, cached in enumerate(embeddings):
+            if cached is None:
+                missing.setdefault(texts[i], []).append(i)
 
         # Generate missing embeddings
-        if texts_to_embed:
+        if missing:
+            texts_to_embed = list(missing)
             logger.info(
                 "Generating embeddings",
                 total=len(texts),
-                cached=len(texts) - len(texts_to_embed),
+                cached=len(texts) - sum(len(indices) for indices in missing.values()),
                 to_generate=len(texts_to_embed)
             )
 
             new_embeddings = await self.vertex_client.embed_texts(texts_to_embed, task_type)
 
-            # Store in cache and update results
-            for i, embedding in enumerate(new_embeddings):
-                result_idx = cache_indices[i]
-                embeddings[result_idx] = embedding
+            # Fan results back out to every position of each text
+            for text, embedding in zip(texts_to_embed, new_embeddings):
+                for i in missing[text]:
+                    embeddings[i] = embedding
 
-                if use_cache:
-                    await self.firestore_client.store_embedding(texts_to_embed[i], embedding)
+            # Store in cache with batched writes (in background)
+            if use_cache:
+                self._spawn_write(self.firestore_client.store_embeddings_batch(
+                    list(zip(texts_to_embed, new_embeddings)),
+                    task_type
+                ))
 
         return embeddings
 
@@ -265,13 +332,32 @@ class EmbeddingService:
         Returns:
             Project embedding
         """
-        # Combine name and description
-        text = project_name
-        if project_description:
-            text = f"{project_name}: {project_description}"
-
+        text = self._project_text(project_name, project_description)
         return await self.get_embedding(text, task_type="RETRIEVAL_DOCUMENT")
 
+    async def embed_project_batch(
+        self,
+        projects: List[Tuple[str, Optional[str]]]
+    ) -> List[np.ndarray]:
+        """
+        Generate embeddings for multiple projects in batched Vertex AI calls.
+
+        Args:
+            projects: List of (project_name, project_description) tuples
+
+        Returns:
+            List of project embeddings, in input order
+        """
+        texts = [self._project_text(name, description) for name, description in projects]
+        return await self.get_embeddings(texts, task_type="RETRIEVAL_DOCUMENT")
+
+    @staticmethod
+    def _project_text(project_name: str, project_description: Optional[str]) -> str:
+        """Combine project name and description into embedding text."""
+        if project_description:
+            return f"{project_name}: {project_description}"
+        return project_name
+
     async def embed_task(self, task_description: str) -> np.ndarray:
         """
         Generate embedding for a task.
@@ -3,22 +3,50 @@ Agent entry point and FastAPI application.
 Handles requests, routes to agent, returns A2A protocol responses.
 """
 
+import asyncio
+import contextlib
 import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, Gauge, generate_latest
+from pydantic import ValidationError
 
 from src.agent import LinearSemanticAgent
 from src.models.task import TaskRequest
 from src.models.decision import AgentResponse
 from src.config.settings import settings
-from src.utils.logger import get_logger
+from src.config.constants import EVALUATE_QUEUE_TIMEOUT_SECONDS, METRICS_REFRESH_SECONDS
+from src.utils.logger import get_logger, sample_exc_info
 
 logger = get_logger(__name__)
 
 # Global agent instance
 agent: LinearSemanticAgent = None
 
+# Bounds in-flight evaluations per worker; excess requests get a fast 429
+_eval_sem = asyncio.Semaphore(settings.agent_max_concurrency)
+
+# Prometheus gauges, refreshed in the background so scrapes never wait on Firestore
+PROJECTS_TOTAL = Gauge("agent_projects_total", "Total number of cached projects")
+CACHE_VALID = Gauge("agent_cache_valid", "Is the projects cache valid")
+AGENT_VERSION = Gauge("agent_version", "Agent version info", ["version"])
+AGENT_VERSION.labels(version=settings.agent_version).set(1)
+
+
+async def _refresh_metrics() -> None:
+    """Update the Prometheus gauges from agent health until cancelled."""
+    while True:
+        try:
+            health = await agent.get_agent_health()
+            PROJECTS_TOTAL.set(health.get("projects_count", 0))
+            CACHE_VALID.set(1 if health.get("cache_valid") else 0)
+        except Exception as e:
+            logger.error("Metrics refresh failed", error=str(e), exc_info=sample_exc_info())
+        await asyncio.sleep(METRICS_REFRESH_SECONDS)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -35,10 +63,18 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to initialize agent", error=str(e), exc_info=True)
         raise
 
+    metrics_task = asyncio.create_task(_refresh_metrics())
+
     yield
 
     # Shutdown
     logger.info("Shutting down Linear Semantic Agent API")
+    metrics_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await metrics_task
+    if agent is not None:
+        await agent.drain()
+        await agent.linear_client.aclose()
 
 
 # Create FastAPI app
@@ -46,21 +82,45 @@ app = FastAPI(
     title="Linear Semantic Agent",
     description="AI agent for validating and categorizing Linear tasks for mapache.app",
     version=settings.agent_version,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson encodes responses natively
 )
 
-
-@app.post("/evaluate-task", response_model=AgentResponse)
-async def evaluate_task(request: TaskRequest) -> AgentResponse:
+# Compress larger responses (reasoning text, metrics) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+
+# No response_model: AgentResponse is already validated, so it is dumped
+# straight to orjson instead of being re-validated on the way out.
+# The body is parsed and validated in one step by pydantic-core from raw
+# bytes; TaskRequest is only declared here for the OpenAPI schema.
+@app.post(
+    "/evaluate-task",
+    responses={200: {"model": AgentResponse}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": TaskRequest.model_json_schema()}},
+            "required": True
+        }
+    }
+)
+async def evaluate_task(http_request: Request) -> ORJSONResponse:
     """
     Evaluate a task and return decision.
 
     Args:
-        request: Task evaluation request
+        http_request: HTTP request whose JSON body is a TaskRequest
 
     Returns:
         Agent decision and reasoning
     """
+    try:
+        request = TaskRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
     if agent is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -73,7 +133,23 @@ async def evaluate_task(request: TaskRequest) -> AgentResponse:
         source=request.source
     )
 
-    start_time = time.time()
+    try:
+        if _eval_sem.locked():
+            # Wait in this task rather than a wait_for wrapper, which can
+            # time out after acquire() won a permit and leak it
+            async with asyncio.timeout(EVALUATE_QUEUE_TIMEOUT_SECONDS):
+                await _eval_sem.acquire()
+        else:
+            # A free permit is taken without suspending
+            await _eval_sem.acquire()
+    except asyncio.TimeoutError:
+        logger.warning("Evaluation rejected, at concurrency limit", task_id=request.task_id)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Agent overloaded, retry later"
+        )
+
+    start_time = time.perf_counter()
 
     try:
         # Convert request to task
@@ -83,7 +159,7 @@ async def evaluate_task(request: TaskRequest) -> AgentResponse:
         decision = await agent.evaluate_task(task)
 
         # Calculate processing time
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.perf_counter() - start_time) * 1000
 
         # Create response
         response = AgentResponse.from_decision(decision, processing_time_ms)
@@ -96,14 +172,14 @@ async def evaluate_task(request: TaskRequest) -> AgentResponse:
             processing_time_ms=processing_time_ms
         )
 
-        return response
+        return ORJSONResponse(response.model_dump())
 
     except Exception as e:
         logger.error(
             "Evaluation failed",
             task_id=request.task_id,
             error=str(e),
-            exc_info=True
+            exc_info=sample_exc_info()
         )
 
         raise HTTPException(
@@ -111,6 +187,9 @@ async def evaluate_task(request: TaskRequest) -> AgentResponse:
             detail=f"Evaluation failed: {str(e)}"
         )
 
+    finally:
+        _eval_sem.release()
+
 
 @app.get("/health")
 async def health_check():
@@ -121,7 +200,7 @@ async def health_check():
         Health status
     """
     if agent is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "unhealthy", "reason": "Agent not initialized"}
         )
@@ -135,8 +214,8 @@ async def health_check():
             "version": settings.agent_version
         }
     except Exception as e:
-        logger.error("Health check failed", error=str(e), exc_info=True)
-        return JSONResponse(
+        logger.error("Health check failed", error=str(e), exc_info=sample_exc_info())
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={"status": "unhealthy", "error": str(e)}
         )
@@ -191,35 +270,9 @@ async def metrics():
     Prometheus metrics endpoint.
 
     Returns:
-        Metrics in Prometheus format
+        Metrics in Prometheus text format
     """
-    # Simplified metrics implementation
-    # In production, use prometheus_client library
-
-    if agent is None:
-        return ""
-
-    try:
-        health = await agent.get_agent_health()
-
-        metrics_text = f"""
-# HELP agent_projects_total Total number of cached projects
-# TYPE agent_projects_total gauge
-agent_projects_total {health.get('projects_count', 0)}
-
-# HELP agent_cache_valid Is the projects cache valid
-# TYPE agent_cache_valid gauge
-agent_cache_valid {1 if health.get('cache_valid') else 0}
-
-# HELP agent_version Agent version info
-# TYPE agent_version gauge
-agent_version{{version="{settings.agent_version}"}} 1
-"""
-        return metrics_text.strip()
-
-    except Exception as e:
-        logger.error("Metrics generation failed", error=str(e), exc_info=True)
-        return ""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
 # Error handlers
@@ -233,7 +286,7 @@ async def http_exception_handler(request, exc):
         detail=exc.detail,
         path=request.url.path
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail}
     )
@@ -246,21 +299,28 @@ async def general_exception_handler(request, exc):
         "Unhandled exception",
         error=str(exc),
         path=request.url.path,
-        exc_info=True
+        exc_info=sample_exc_info()
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"error": "Internal server error"}
     )
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
 
+    # uvloop + httptools (uvicorn[standard]); reload mode is single-process
+    workers = 1 if settings.debug else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8080,
         log_level=settings.log_level.lower(),
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
+        workers=workers
     )
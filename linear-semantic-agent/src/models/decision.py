@@ -1,10 +1,14 @@
 """Decision data model for agent output."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+# Timezone-aware UTC clock; skips the local timezone lookup of datetime.now()
+_now = partial(datetime.now, timezone.utc)
+
 
 class DecisionType(str, Enum):
     """Decision types for task evaluation."""
@@ -14,8 +18,8 @@ class DecisionType(str, Enum):
     CLARIFY = "clarify"              # Ask for more information
 
 
-class Decision(BaseModel):
-    """Agent decision output model."""
+class _DecisionFields(BaseModel):
+    """Fields shared by Decision and AgentResponse."""
 
     decision: DecisionType = Field(..., description="Decision type")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0.0-1.0)")
@@ -37,11 +41,15 @@ class Decision(BaseModel):
     blocking_issues: List[str] = Field(default_factory=list, description="Blocking issue IDs")
     clarification_questions: List[str] = Field(default_factory=list, description="Questions to ask user")
 
+
+class Decision(_DecisionFields):
+    """Agent decision output model."""
+
     # Audit
-    created_at: datetime = Field(default_factory=datetime.now, description="Decision timestamp")
+    created_at: datetime = Field(default_factory=_now, description="Decision timestamp")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "decision": "add",
                 "confidence": 0.95,
@@ -51,41 +59,18 @@ class Decision(BaseModel):
                 "tags": ["saaS_integrations", "mcp"]
             }
         }
+    )
 
 
-class AgentResponse(BaseModel):
+class AgentResponse(_DecisionFields):
     """Complete agent response including decision and metadata."""
 
-    decision: DecisionType
-    confidence: float
-    mapped_project: Optional[str] = None
-    mapped_issue: Optional[str] = None
-    consolidate_with: List[str] = Field(default_factory=list)
-    reasoning: str
-    suggested_action: str
-    alignment_score: float
-    tags: List[str] = Field(default_factory=list)
-    blocking_issues: List[str] = Field(default_factory=list)
-    clarification_questions: List[str] = Field(default_factory=list)
-
     # Processing metadata
     processing_time_ms: Optional[float] = None
     agent_version: str = "1.0.0"
 
     @classmethod
     def from_decision(cls, decision: Decision, processing_time_ms: float = None):
-        """Create response from decision."""
-        return cls(
-            decision=decision.decision,
-            confidence=decision.confidence,
-            mapped_project=decision.mapped_project,
-            mapped_issue=decision.mapped_issue,
-            consolidate_with=decision.consolidate_with,
-            reasoning=decision.reasoning,
-            suggested_action=decision.suggested_action,
-            alignment_score=decision.alignment_score,
-            tags=decision.tags,
-            blocking_issues=decision.blocking_issues,
-            clarification_questions=decision.clarification_questions,
-            processing_time_ms=processing_time_ms
-        )
+        """Create response from decision (already validated, so not re-validated)."""
+        shared = {name: decision.__dict__[name] for name in _DecisionFields.model_fields}
+        return cls.model_construct(**shared, processing_time_ms=processing_time_ms)
@@ -3,9 +3,27 @@ Embedded mapache.app context for semantic understanding.
 This is the business domain knowledge that guides all decisions.
 """
 
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Hashable, Optional
 from dataclasses import dataclass
 
+from src.utils.keyword_index import KeywordIndex, compile_keywords
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    """Everything MapacheContext derives from one task description."""
+
+    is_valid: bool
+    domain: Optional[str]
+    filter_category: Optional[str]
+    tags: List[str]
+    confidence_modifier: float
+
+    # Distinct keywords matched per bucket
+    mapache_count: int
+    filter_count: int
+    red_flag_count: int
+
 
 @dataclass
 class MapacheContext:
@@ -97,103 +115,165 @@ class MapacheContext:
     ]
 
     @staticmethod
-    def is_valid_mapache_work(task_description: str) -> bool:
-        """Check if task aligns with mapache.app"""
-        description_lower = task_description.lower()
+    def analyze(task_description: str) -> AnalysisResult:
+        """
+        Scan the description once and derive all context signals from it.
+
+        Equivalent to calling is_valid_mapache_work, get_domain,
+        get_filter_category, get_tags and get_confidence_modifier, but the
+        description is walked by a single regex instead of once per bucket.
 
-        # Check for mapache keywords
-        mapache_score = sum(1 for kw in MapacheContext.MAPACHE_KEYWORDS if kw in description_lower)
+        Args:
+            task_description: Task description
 
-        # Check for filter keywords
-        filter_score = sum(1 for kw in MapacheContext.FILTER_OUT_KEYWORDS if kw in description_lower)
+        Returns:
+            AnalysisResult with every context signal
+        """
+        counts = _ANALYSIS_INDEX.counts(task_description)
 
-        # Check for red flags
-        has_red_flags = any(flag in description_lower for flag in MapacheContext.RED_FLAGS)
+        domain = next((d for d, label in _DOMAIN_LABELS if label in counts), None)
+        filter_category = next((c for c, label in _FILTER_CATEGORY_LABELS if label in counts), None)
 
-        # Decision logic
-        if has_red_flags or filter_score > 0:
+        tags = {tag for tag, label in _TECH_LABELS if label in counts}
+        if domain:
+            tags.add(domain)
+
+        mapache_count = counts.get("mapache", 0)
+        filter_count = counts.get("filter", 0)
+        red_flag_count = counts.get("redflag", 0)
+
+        return AnalysisResult(
+            is_valid=mapache_count > 0 and not filter_count and not red_flag_count,
+            domain=domain,
+            filter_category=filter_category,
+            tags=list(tags),
+            confidence_modifier=_confidence_modifier(task_description, counts),
+            mapache_count=mapache_count,
+            filter_count=filter_count,
+            red_flag_count=red_flag_count
+        )
+
+    @staticmethod
+    def is_valid_mapache_work(task_description: str) -> bool:
+        """Check if task aligns with mapache.app"""
+        # Red flags or filter keywords rule the task out
+        if _REDFLAG_RE.search(task_description) or _FILTER_RE.search(task_description):
             return False
-        if mapache_score > 0:
-            return True
 
-        return False
+        # Otherwise any mapache keyword makes it valid
+        return _MAPACHE_RE.search(task_description) is not None
 
     @staticmethod
     def get_domain(task_description: str) -> Optional[str]:
         """Identify domain: core_platform, saaS_integrations, intelligence_features, internal_ops, invalid"""
-        description_lower = task_description.lower()
-
-        # Check each domain
-        for domain, keywords in MapacheContext.VALID_DOMAINS.items():
-            if any(kw.lower() in description_lower for kw in keywords):
-                return domain
-
-        return None
+        counts = _DOMAIN_INDEX.counts(task_description)
+        return next((d for d in _DOMAINS if d in counts), None)
 
     @staticmethod
     def get_filter_category(task_description: str) -> Optional[str]:
         """Return filter category if applies (personal, learning, deprecated, etc.)"""
-        description_lower = task_description.lower()
-
-        for category, keywords in MapacheContext.FILTER_OUT_RULES.items():
-            if any(kw.lower() in description_lower for kw in keywords):
-                return category
-
-        return None
+        counts = _FILTER_CATEGORY_INDEX.counts(task_description)
+        return next((c for c in _FILTER_CATEGORIES if c in counts), None)
 
     @staticmethod
     def get_tags(task_description: str) -> List[str]:
         """Extract relevant tags from task description."""
-        tags = []
-        description_lower = task_description.lower()
+        counts = _TAG_INDEX.counts(task_description)
 
-        # Domain tags
-        domain = MapacheContext.get_domain(description_lower)
+        # Technology tags
+        tags = {tag for tag, label in _TECH_LABELS if label in counts}
+
+        # Domain tag
+        domain = next((d for d, label in _DOMAIN_LABELS if label in counts), None)
         if domain:
-            tags.append(domain)
+            tags.add(domain)
 
-        # Technology tags
-        tech_tags = {
-            "mcp": ["mcp", "model context protocol"],
-            "agent": ["agent", "sub-agent"],
-            "a2ui": ["a2ui", "user interface"],
-            "integration": ["integration", "oauth"],
-            "embeddings": ["embeddings", "semantic", "rag"],
-            "deployment": ["deployment", "docker", "kubernetes"],
-            "gcp": ["gcp", "google cloud", "vertex ai"]
-        }
-
-        for tag, keywords in tech_tags.items():
-            if any(kw in description_lower for kw in keywords):
-                tags.append(tag)
-
-        return list(set(tags))
+        return list(tags)
 
     @staticmethod
     def get_confidence_modifier(task_description: str) -> float:
         """Get confidence modifier based on description quality and red flags."""
-        description = task_description.strip()
-
-        # Empty or very short descriptions
-        if len(description) < 10:
+        # Empty or very short descriptions need no keyword scan
+        if len(task_description.strip()) < 10:
             return 0.3
 
-        # Check for red flags
-        has_red_flags = any(flag in description.lower() for flag in MapacheContext.RED_FLAGS)
-        if has_red_flags:
-            return 0.5
-
-        # Check for clarity indicators
-        clarity_indicators = ["implement", "build", "create", "deploy", "setup", "configure"]
-        has_clarity = any(ind in description.lower() for ind in clarity_indicators)
-
-        # Check for vague indicators
-        vague_indicators = ["maybe", "possibly", "think about", "consider", "explore"]
-        has_vague = any(ind in description.lower() for ind in vague_indicators)
-
-        if has_clarity and not has_vague:
-            return 1.0
-        elif has_vague:
-            return 0.6
-        else:
-            return 0.8
+        return _confidence_modifier(task_description, _QUALITY_INDEX.counts(task_description))
+
+
+def _confidence_modifier(task_description: str, counts: Dict[Hashable, int]) -> float:
+    """
+    Map description length and quality keyword hits to a confidence modifier.
+
+    Args:
+        task_description: Task description
+        counts: Keyword counts with at least the "redflag", "clarity" and
+            "vague" labels (from a KeywordIndex)
+
+    Returns:
+        Confidence modifier
+    """
+    if len(task_description.strip()) < 10:
+        return 0.3
+    if "redflag" in counts:
+        return 0.5
+    if "vague" in counts:
+        return 0.6
+    if "clarity" in counts:
+        return 1.0
+    return 0.8
+
+
+# Keyword buckets compiled once at import; each check is a single regex scan
+# of the description instead of one substring scan per keyword
+_MAPACHE_RE = compile_keywords(MapacheContext.MAPACHE_KEYWORDS)
+_FILTER_RE = compile_keywords(MapacheContext.FILTER_OUT_KEYWORDS)
+_REDFLAG_RE = compile_keywords(MapacheContext.RED_FLAGS)
+_CLARITY_INDICATORS = ["implement", "build", "create", "deploy", "setup", "configure"]
+_VAGUE_INDICATORS = ["maybe", "possibly", "think about", "consider", "explore"]
+
+_TECH_TAGS: Dict[str, List[str]] = {
+    "mcp": ["mcp", "model context protocol"],
+    "agent": ["agent", "sub-agent"],
+    "a2ui": ["a2ui", "user interface"],
+    "integration": ["integration", "oauth"],
+    "embeddings": ["embeddings", "semantic", "rag"],
+    "deployment": ["deployment", "docker", "kubernetes"],
+    "gcp": ["gcp", "google cloud", "vertex ai"]
+}
+
+
+# Labelled keyword buckets, indexed once per process
+_DOMAIN_BUCKETS = list(MapacheContext.VALID_DOMAINS.items())
+_FILTER_CATEGORY_BUCKETS = list(MapacheContext.FILTER_OUT_RULES.items())
+
+# Names in priority order, paired with their labels in the combined indexes,
+# so lookups iterate a local tuple instead of rebuilding label keys per call
+_DOMAINS = tuple(MapacheContext.VALID_DOMAINS)
+_FILTER_CATEGORIES = tuple(MapacheContext.FILTER_OUT_RULES)
+_DOMAIN_LABELS = tuple((d, ("domain", d)) for d in _DOMAINS)
+_FILTER_CATEGORY_LABELS = tuple((c, ("filter_category", c)) for c in _FILTER_CATEGORIES)
+_TECH_LABELS = tuple((t, ("tech", t)) for t in _TECH_TAGS)
+
+_DOMAIN_INDEX = KeywordIndex(_DOMAIN_BUCKETS)
+_FILTER_CATEGORY_INDEX = KeywordIndex(_FILTER_CATEGORY_BUCKETS)
+_QUALITY_INDEX = KeywordIndex([
+    ("redflag", MapacheContext.RED_FLAGS),
+    ("clarity", _CLARITY_INDICATORS),
+    ("vague", _VAGUE_INDICATORS),
+])
+_TAG_INDEX = KeywordIndex(
+    [(("domain", d), kws) for d, kws in _DOMAIN_BUCKETS]
+    + [(("tech", t), kws) for t, kws in _TECH_TAGS.items()]
+)
+_ANALYSIS_INDEX = KeywordIndex(
+    [
+        ("mapache", MapacheContext.MAPACHE_KEYWORDS),
+        ("filter", MapacheContext.FILTER_OUT_KEYWORDS),
+        ("redflag", MapacheContext.RED_FLAGS),
+        ("clarity", _CLARITY_INDICATORS),
+        ("vague", _VAGUE_INDICATORS),
+    ]
+    + [(("domain", d), kws) for d, kws in _DOMAIN_BUCKETS]
+    + [(("filter_category", c), kws) for c, kws in _FILTER_CATEGORY_BUCKETS]
+    + [(("tech", t), kws) for t, kws in _TECH_TAGS.items()]
+)
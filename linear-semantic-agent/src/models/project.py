@@ -1,10 +1,13 @@
 """Project data model for Linear projects."""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, model_validator
 import numpy as np
 
+from src.utils.embedding_blob import decode_embedding, encode_embedding
+from src.utils.similarity import normalize, quantize_vector
+
 
 class LinearProject(BaseModel):
     """Represents a Linear project with semantic information."""
@@ -20,15 +23,18 @@ class LinearProject(BaseModel):
     cached_at: Optional[datetime] = Field(None, description="Cache timestamp")
 
     # Semantic fields
-    embedding: Optional[List[float]] = Field(None, description="Text embedding vector")
+    embedding: Optional[List[float]] = Field(None, description="Text embedding vector (legacy list form)")
+    embedding_bytes: Optional[bytes] = Field(None, description="Text embedding as big-endian float32 bytes")
+    embedding_int8: Optional[bytes] = Field(None, description="Unit-length embedding quantized to int8")
+    embedding_scale: Optional[float] = Field(None, description="Dequantization scale for embedding_int8")
     alignment_score: Optional[float] = Field(None, description="Mapache alignment score")
     domain: Optional[str] = Field(None, description="Domain: core_platform, saaS_integrations, etc")
 
     # Raw data
     raw_data: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Full Linear API response")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "proj_123abc",
                 "name": "Linear Semantic Agent",
@@ -38,8 +44,77 @@ class LinearProject(BaseModel):
                 "domain": "core_platform",
                 "alignment_score": 0.95
             }
-        }
-        arbitrary_types_allowed = True
+        },
+        arbitrary_types_allowed=True
+    )
+
+    @model_validator(mode="after")
+    def _pack_embedding(self) -> "LinearProject":
+        """Pack a legacy list embedding into float32 bytes on construction."""
+        if self.embedding and self.embedding_bytes is None:
+            self.set_embedding(self.embedding)
+        return self
+
+    @field_serializer("embedding_bytes", when_used="json")
+    def _serialize_embedding_bytes(self, value: Optional[bytes]) -> Optional[List[float]]:
+        """Emit the packed embedding as a list of floats in JSON output."""
+        if value is None:
+            return None
+        return decode_embedding(value).tolist()
+
+    @field_serializer("embedding_int8", when_used="json")
+    def _serialize_embedding_int8(self, value: Optional[bytes]) -> Optional[List[int]]:
+        """Emit the quantized embedding as a list of ints in JSON output."""
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype=np.int8).tolist()
+
+    @property
+    def has_embedding(self) -> bool:
+        """Whether the project carries an embedding in either form."""
+        return self.embedding_bytes is not None or bool(self.embedding)
+
+    def embedding_vector(self) -> Optional[np.ndarray]:
+        """
+        Get the embedding as a float32 vector.
+
+        Returns:
+            embedding_bytes decoded to native float32 when set, otherwise
+            the legacy list converted to an array, or None
+        """
+        if self.embedding_bytes is not None:
+            return decode_embedding(self.embedding_bytes)
+        if self.embedding:
+            return np.asarray(self.embedding, dtype=np.float32)
+        return None
+
+    def quantized_embedding(self) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Get the int8-quantized unit-length embedding used for similarity search.
+
+        Returns:
+            Tuple of (read-only int8 view over embedding_int8, scale), quantizing
+            and storing it first if only the float form is present, or None
+        """
+        if self.embedding_int8 is None:
+            vector = self.embedding_vector()
+            if vector is None:
+                return None
+            self._set_quantized(vector)
+        return np.frombuffer(self.embedding_int8, dtype=np.int8), self.embedding_scale
+
+    def set_embedding(self, vector: np.ndarray) -> None:
+        """Store an embedding as float32 bytes and int8, replacing any list form."""
+        vector = np.asarray(vector, dtype=np.float32)
+        self.embedding_bytes = encode_embedding(vector)
+        self.embedding = None
+        self._set_quantized(vector)
+
+    def _set_quantized(self, vector: np.ndarray) -> None:
+        """Normalize and quantize vector into embedding_int8/embedding_scale."""
+        values, scale = quantize_vector(normalize(vector))
+        self.embedding_int8 = values.tobytes()
+        self.embedding_scale = scale
 
 
 class LinearIssue(BaseModel):
@@ -56,8 +131,8 @@ class LinearIssue(BaseModel):
 
     raw_data: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Full Linear API response")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "MAPAI-123",
                 "title": "Implement semantic search",
@@ -66,6 +141,7 @@ class LinearIssue(BaseModel):
                 "priority": 2
             }
         }
+    )
 
 
 class Match(BaseModel):
@@ -75,11 +151,12 @@ class Match(BaseModel):
     similarity_score: float = Field(..., description="Cosine similarity score (0.0-1.0)")
     match_reason: Optional[str] = Field(None, description="Explanation of match")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "project": {"id": "proj_123", "name": "Semantic Search"},
                 "similarity_score": 0.82,
                 "match_reason": "Both involve semantic search functionality"
             }
         }
+    )
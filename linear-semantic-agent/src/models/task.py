@@ -1,8 +1,12 @@
 """Task data model for incoming tasks to be evaluated."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Timezone-aware UTC clock; skips the local timezone lookup of datetime.now()
+_now = partial(datetime.now, timezone.utc)
 
 
 class Task(BaseModel):
@@ -12,12 +16,12 @@ class Task(BaseModel):
     task_description: str = Field(..., description="Task description/title")
     source: str = Field(..., description="Source system: linear, clickup, trello, google_tasks")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
-    created_at: Optional[datetime] = Field(default_factory=datetime.now, description="Creation timestamp")
+    created_at: Optional[datetime] = Field(default_factory=_now, description="Creation timestamp")
     priority: Optional[str] = Field(None, description="Priority: high, medium, low")
     assigned_to: Optional[str] = Field(None, description="Assignee email")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "task_id": "CLK-123",
                 "task_description": "Build Slack MCP server integration",
@@ -29,6 +33,7 @@ class Task(BaseModel):
                 "priority": "high"
             }
         }
+    )
 
 
 class TaskRequest(BaseModel):
@@ -40,8 +45,8 @@ class TaskRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
     def to_task(self) -> Task:
-        """Convert request to Task model."""
-        return Task(
+        """Convert request to Task model (fields already validated, so not re-validated)."""
+        return Task.model_construct(
             task_id=self.task_id,
             task_description=self.task_description,
             source=self.source,
@@ -1,58 +1,128 @@
 
-import os
-from typing import List, Optional
-from src.agent import LinearSemanticAgent
+import asyncio
+import threading
+from typing import Dict, List, Optional
 from src.models.task import Task
-from src.models.decision import Decision
+from src.config.constants import QUERY_TIMEOUT_SECONDS
+from src.utils.logger import sample_exc_info
 
 class LinearReasoningAgent:
     """Wrapper for LinearSemanticAgent to be used with Vertex AI Reasoning Engine."""
     
     def __init__(self):
         self.agent = None
+        # Created lazily on the serving side: loops and threads don't pickle
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_task: Optional[asyncio.Task] = None
+        self._logger = None
 
     def set_up(self):
-        """No-op set_up for faster deployment. Real init happens in query."""
-        print("Reasoning Engine set_up called.")
-        pass
+        """
+        Initialize the agent during Reasoning Engine warm-up.
 
-    def _ensure_init(self):
-        """Ensure the agent is initialized."""
+        This lengthens deployment warm-up but keeps agent start-up out of
+        the first user-facing query. query() still calls _ensure_init()
+        as an idempotent guard.
+        """
+        self.logger.info("Reasoning Engine set_up called")
+        self._ensure_init()
+
+    @property
+    def logger(self):
+        """Structured logger, created lazily: bound loggers don't pickle."""
+        if self._logger is None:
+            from src.utils.logger import get_logger
+            self._logger = get_logger(__name__)
+        return self._logger
+
+    @property
+    def _loop_lock(self) -> threading.Lock:
+        """Guards loop start-up, created lazily: locks don't pickle."""
+        # dict.setdefault is atomic, so racing threads get the same lock
+        return self.__dict__.setdefault("_loop_lock_", threading.Lock())
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the dedicated event loop thread once and return its loop."""
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
+    def _run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the background loop and block for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    async def _arun(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the background loop and await it from the caller's loop."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def _initialize(self):
+        """
+        Initialize the agent once; runs on the background loop.
+
+        Concurrent first queries all await the same task, so only one
+        agent is created. The task is shielded so a caller timing out
+        doesn't cancel it for the others.
+        """
         if self.agent is not None:
             return
-            
-        import asyncio
-        print("Initializing LinearSemanticAgent...")
+        if self._init_task is None:
+            self._init_task = asyncio.ensure_future(self._create_agent())
+        await asyncio.shield(self._init_task)
+
+    async def _create_agent(self):
+        """Create and initialize the agent; runs on the background loop."""
+        self.logger.info("Initializing LinearSemanticAgent")
         try:
             from src.agent import LinearSemanticAgent
-            self.agent = LinearSemanticAgent()
-            
-            # Use existing loop if available
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            if loop.is_running():
-                # In Vertex AI managed env, we might be inside a loop already
-                # We need to run this as a task or use a helper
-                import nest_asyncio
-                nest_asyncio.apply()
-            
-            loop.run_until_complete(self.agent.initialize())
-            print("Agent initialized successfully.")
+            agent = LinearSemanticAgent()
+            await agent.initialize()
+            self.agent = agent
+            self.logger.info("Agent initialized successfully")
         except Exception as e:
-            print(f"FAILED to initialize agent: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception("Agent initialization failed", error=str(e))
+            # Let the next query retry
+            self._init_task = None
             raise
 
+    def _ensure_init(self):
+        """Ensure the agent is initialized."""
+        if self.agent is None:
+            self._run(self._initialize())
+
+    @staticmethod
+    def _response(decision) -> dict:
+        """Build the query response for a decision."""
+        return {
+            "decision": decision.decision.value,
+            "confidence": decision.confidence,
+            "reasoning": decision.reasoning,
+            "suggested_action": decision.suggested_action,
+            "alignment_score": decision.alignment_score,
+            "tags": decision.tags
+        }
+
+    def _error_response(self, error: Exception) -> dict:
+        """Build the query response for a failure; called inside the except block."""
+        return {"error": str(error)}
+
     def query(self, task_description: str, source: str = "user", task_id: str = "raw") -> dict:
-        """Evaluate a task."""
-        import asyncio
-        from src.models.task import Task
-        
+        """Evaluate a task (blocking; for sync callers)."""
+        if _loop_running():
+            raise RuntimeError("query() would block the running event loop; await async_query() instead")
         self._ensure_init()
         
         task = Task(
@@ -62,16 +132,50 @@ class LinearReasoningAgent:
         )
         
         try:
-            loop = asyncio.get_event_loop()
-            decision = loop.run_until_complete(self.agent.evaluate_task(task))
-            return {
-                "decision": decision.decision.value,
-                "confidence": decision.confidence,
-                "reasoning": decision.reasoning,
-                "suggested_action": decision.suggested_action,
-                "alignment_score": decision.alignment_score,
-                "tags": decision.tags
-            }
+            decision = self._run(
+                self.agent.evaluate_task(task),
+                timeout=QUERY_TIMEOUT_SECONDS
+            )
+            return self._response(decision)
         except Exception as e:
-            print(f"Query failed: {e}")
-            return {"error": str(e)}
+            self.logger.error("Query failed", task_id=task_id, error=str(e), exc_info=sample_exc_info())
+            return self._error_response(e)
+
+    async def async_query(self, task_description: str, source: str = "user", task_id: str = "raw") -> dict:
+        """
+        Evaluate a task without blocking the caller's event loop.
+
+        The agent stays on the dedicated background loop its clients were
+        created on; the caller only awaits the result.
+        """
+        if self.agent is None:
+            await self._arun(self._initialize())
+
+        task = Task(
+            task_description=task_description,
+            source=source,
+            task_id=task_id
+        )
+
+        try:
+            decision = await self._arun(
+                self.agent.evaluate_task(task),
+                timeout=QUERY_TIMEOUT_SECONDS
+            )
+            return self._response(decision)
+        except Exception as e:
+            self.logger.error("Query failed", task_id=task_id, error=str(e), exc_info=sample_exc_info())
+            return self._error_response(e)
+
+    def register_operations(self) -> Dict[str, List[str]]:
+        """Expose query for sync callers and async_query on the engine's own loop."""
+        return {"": ["query"], "async": ["async_query"]}
+
+
+def _loop_running() -> bool:
+    """Whether the calling thread is already running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
@@ -3,13 +3,16 @@ Semantic reasoning engine.
 Core decision logic using mapache.app context and similarity matching.
 """
 
-from typing import List, Tuple, Optional
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple, Optional
 import numpy as np
 
 from src.models.task import Task
 from src.models.project import LinearProject, Match
 from src.models.decision import Decision, DecisionType
-from src.models.mapache_context import MapacheContext
+from src.models.mapache_context import MapacheContext, AnalysisResult
 from src.config.constants import (
     SIMILARITY_THRESHOLD_MATCH,
     SIMILARITY_THRESHOLD_DUPLICATE,
@@ -19,19 +22,69 @@ from src.config.constants import (
     SCORE_WEIGHT_RED_FLAGS,
     ALIGNMENT_SCORE_THRESHOLD,
     CONFIDENCE_FILTER,
+    SIMILARITY_OFFLOAD_MIN_SCORES,
+    QUANTIZED_RESCORE_MARGIN,
     MIN_DESCRIPTION_LENGTH
 )
-from src.utils.similarity import cosine_similarity, find_most_similar
+from src.utils.similarity import (
+    cosine_similarity,
+    batch_scores_normalized,
+    batch_scores_quantized,
+    normalize_rows,
+    top_matches,
+    QuantizedMatrix
+)
 from src.utils.text_processing import (
-    normalize_text,
     is_empty_or_vague,
-    extract_keywords,
-    extract_project_indicators
+    extract_keyword_set,
+    PROJECT_INDICATORS
 )
+from src.utils.embedding_blob import EMBEDDING_DTYPE
+from src.utils.keyword_index import KeywordIndex
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_CLARITY_INDICATORS = frozenset({
+    'implement', 'build', 'create', 'deploy', 'setup', 'configure',
+    'add', 'remove', 'update', 'fix', 'optimize', 'integrate'
+})
+_VAGUE_INDICATORS = frozenset({'maybe', 'possibly', 'think about', 'consider', 'explore'})
+_TECH_TERMS = frozenset({'api', 'database', 'service', 'endpoint', 'component', 'module'})
+
+# Clarity and project indicators, matched as substrings, case-insensitively
+_FEATURE_INDEX = KeywordIndex(
+    [
+        ("clarity", _CLARITY_INDICATORS),
+        ("vague", _VAGUE_INDICATORS),
+        ("technical", _TECH_TERMS),
+    ]
+    + [(("indicator", category), terms) for category, terms in PROJECT_INDICATORS.items()]
+)
+
+_FILTER_CATEGORY_SCORE = 0.1  # Strong signal to filter out
+
+
+@dataclass(frozen=True)
+class TaskFeatures:
+    """Everything ReasoningEngine derives from one task description."""
+
+    analysis: AnalysisResult
+    indicators: FrozenSet[str]  # Project indicator categories
+    keywords: FrozenSet[str]
+    has_clarity: bool
+    has_vague: bool
+    has_technical: bool
+
+
+@lru_cache(maxsize=4096)
+def _project_keywords(name: str, description: Optional[str]) -> FrozenSet[str]:
+    """Distinct keywords of a project's name and description."""
+    keywords = extract_keyword_set(name)
+    if description:
+        keywords = keywords | extract_keyword_set(description)
+    return keywords
+
 
 class ReasoningEngine:
     """Semantic reasoning engine for task evaluation."""
@@ -39,13 +92,23 @@ class ReasoningEngine:
     def __init__(self):
         """Initialize reasoning engine."""
         self.context = MapacheContext()
+
+        # Normalized embedding matrix for callers that don't pass one,
+        # rebuilt only when the project set or an embedding changes.
+        # (projects, embedding sources, matrix), swapped as one tuple since
+        # matching may run on a worker thread
+        self._emb_cache: Tuple[List[LinearProject], List[object], Optional[np.ndarray]] = ([], [], None)
+
+        # Features of a blank description, shared by every blank task
+        self._blank_features = self._extract_features(Task.model_construct(task_description=""))
         logger.info("Reasoning engine initialized")
 
     async def evaluate(
         self,
         task: Task,
         task_embedding: np.ndarray,
-        existing_projects: List[LinearProject]
+        existing_projects: List[LinearProject],
+        projects_matrix: Optional[QuantizedMatrix] = None
     ) -> Decision:
         """
         Evaluate task and make decision.
@@ -54,96 +117,204 @@ class ReasoningEngine:
             task: Task to evaluate
             task_embedding: Task embedding vector
             existing_projects: List of existing Linear projects
+            projects_matrix: Optional quantized, normalized embedding matrix
+                whose row i belongs to existing_projects[i]
 
         Returns:
             Decision object
         """
-        logger.info("Evaluating task", task_id=task.task_id, source=task.source)
+        decisions = await self.evaluate_batch(
+            [task], [task_embedding], existing_projects, projects_matrix
+        )
+        return decisions[0]
 
-        # Step 1: Normalize task
-        normalized_desc = normalize_text(task.task_description)
+    async def evaluate_batch(
+        self,
+        tasks: List[Task],
+        task_embeddings: List[np.ndarray],
+        existing_projects: List[LinearProject],
+        projects_matrix: Optional[QuantizedMatrix] = None
+    ) -> List[Decision]:
+        """
+        Evaluate several tasks against the same projects.
 
-        # Step 2: Filter by context (is it mapache work?)
-        filter_score = self.filter_score(task)
-        logger.debug("Filter score", score=filter_score)
+        Tasks that pass the filter and clarity checks are matched against
+        the projects together, with one matrix product for the whole batch.
 
-        if filter_score < CONFIDENCE_FILTER:
-            return self._create_filter_decision(task, filter_score)
+        Args:
+            tasks: Tasks to evaluate
+            task_embeddings: Embedding vector of each task
+            existing_projects: List of existing Linear projects
+            projects_matrix: Optional quantized, normalized embedding matrix
+                whose row i belongs to existing_projects[i]
 
-        # Step 3: Check clarity
-        clarity_score = self.clarity_score(task)
-        logger.debug("Clarity score", score=clarity_score)
+        Returns:
+            Decision for each task, in order
+        """
+        decisions: List[Optional[Decision]] = [None] * len(tasks)
+        screened = []
+
+        for i, task in enumerate(tasks):
+            # Bound once so each step's log line carries the task context
+            log = logger.bind(task_id=task.task_id, source=task.source)
+            log.info("Evaluating task")
+
+            # Blank descriptions can only be clarified; skip every scan
+            if not task.task_description.strip():
+                clarity_score = self.clarity_score(task, self._blank_features)
+                decisions[i] = self._create_clarify_decision(task, clarity_score, self._blank_features)
+                continue
+
+            # A filter category decides the task on its own, before the
+            # remaining feature scans
+            analysis = self.context.analyze(task.task_description)
+            if analysis.filter_category:
+                log.debug("Filter category detected", category=analysis.filter_category)
+                decisions[i] = self._create_filter_decision(task, _FILTER_CATEGORY_SCORE, analysis)
+                continue
+
+            # Features shared by every scoring and decision step below
+            features = self._extract_features(task, analysis)
+
+            # Step 1: Filter by context (is it mapache work?)
+            filter_score = self.filter_score(task, features)
+            log.debug("Filter score", score=filter_score)
+
+            if filter_score < CONFIDENCE_FILTER:
+                decisions[i] = self._create_filter_decision(task, filter_score, analysis)
+                continue
+
+            # Step 2: Check clarity
+            clarity_score = self.clarity_score(task, features)
+            log.debug("Clarity score", score=clarity_score)
+
+            if clarity_score < 0.4:
+                decisions[i] = self._create_clarify_decision(task, clarity_score, features)
+                continue
+
+            screened.append((i, log, features, filter_score, clarity_score))
+
+        if not screened:
+            return decisions
+
+        # Step 3: Similarity matching for every remaining task at once.
+        # Large products run on a worker thread (BLAS releases the GIL) so
+        # the event loop keeps serving; small ones aren't worth the handoff
+        match_args = (
+            [task_embeddings[i] for i, *_ in screened],
+            existing_projects,
+            projects_matrix
+        )
+        if len(screened) * len(existing_projects) >= SIMILARITY_OFFLOAD_MIN_SCORES:
+            all_matches = await asyncio.to_thread(self._find_similar_projects_batch, *match_args)
+        else:
+            all_matches = self._find_similar_projects_batch(*match_args)
 
-        if clarity_score < 0.4:
-            return self._create_clarify_decision(task, clarity_score)
+        for (i, log, features, filter_score, clarity_score), matches in zip(screened, all_matches):
+            log.debug("Found matches", count=len(matches))
+            decisions[i] = self._decide(tasks[i], matches, filter_score, clarity_score, features, log)
 
-        # Step 4: Similarity matching
-        matches = self._find_similar_projects(task_embedding, existing_projects)
-        logger.debug("Found matches", count=len(matches))
+        return decisions
 
-        # Step 5: Duplicate detection
+    def _decide(
+        self,
+        task: Task,
+        matches: List[Match],
+        filter_score: float,
+        clarity_score: float,
+        features: TaskFeatures,
+        log=logger
+    ) -> Decision:
+        """Decide on a screened task from its project matches."""
+        # Step 4: Duplicate detection
         if matches:
             best_match = matches[0]
-            duplicate_score = self.duplicate_score(task, best_match.project, best_match.similarity_score)
-            logger.debug("Duplicate score", score=duplicate_score, best_similarity=best_match.similarity_score)
+            duplicate_score = self.duplicate_score(
+                task, best_match.project, best_match.similarity_score, features
+            )
+            log.debug("Duplicate score", score=duplicate_score, best_similarity=best_match.similarity_score)
 
             if duplicate_score >= 0.75:
-                return self._create_consolidate_decision(task, matches, duplicate_score)
+                return self._create_consolidate_decision(task, matches, duplicate_score, features)
 
-        # Step 6: Alignment scoring
+        # Step 5: Alignment scoring
         alignment_score = self.alignment_score(
             filter_score,
             matches[0].similarity_score if matches else 0.0,
             clarity_score
         )
-        logger.debug("Alignment score", score=alignment_score)
+        log.debug("Alignment score", score=alignment_score)
 
-        # Step 7: Make decision
+        # Step 6: Make decision
         if alignment_score >= ALIGNMENT_SCORE_THRESHOLD:
-            return self._create_add_decision(task, matches, alignment_score, filter_score, clarity_score)
+            return self._create_add_decision(
+                task, matches, alignment_score, filter_score, clarity_score, features
+            )
         else:
-            return self._create_clarify_decision(task, clarity_score)
+            return self._create_clarify_decision(task, clarity_score, features)
 
-    def filter_score(self, task: Task) -> float:
+    def _extract_features(
+        self,
+        task: Task,
+        analysis: Optional[AnalysisResult] = None
+    ) -> TaskFeatures:
         """
-        Calculate filter score (0.0 = definitely not mapache, 1.0 = definitely mapache).
+        Derive every scoring signal of a task description up front.
+
+        Two keyword scans (mapache context and clarity/project indicators)
+        replace the per-step rescans of the description.
 
         Args:
             task: Task to evaluate
+            analysis: Precomputed context analysis of the task description
 
         Returns:
-            Filter score (0.0-1.0)
+            TaskFeatures for the task
         """
-        description_lower = task.task_description.lower()
+        description = task.task_description
+        found = _FEATURE_INDEX.counts(description)
+
+        return TaskFeatures(
+            analysis=analysis if analysis is not None else self.context.analyze(description),
+            indicators=frozenset(label[1] for label in found if isinstance(label, tuple)),
+            keywords=extract_keyword_set(description),
+            has_clarity="clarity" in found,
+            has_vague="vague" in found,
+            has_technical="technical" in found
+        )
 
-        # Check for filter-out categories
-        filter_category = self.context.get_filter_category(description_lower)
-        if filter_category:
-            logger.debug("Filter category detected", category=filter_category)
-            return 0.1  # Strong signal to filter out
+    def filter_score(self, task: Task, features: Optional[TaskFeatures] = None) -> float:
+        """
+        Calculate filter score (0.0 = definitely not mapache, 1.0 = definitely mapache).
 
-        # Check for mapache keywords
-        mapache_count = sum(1 for kw in self.context.MAPACHE_KEYWORDS if kw in description_lower)
+        Args:
+            task: Task to evaluate
+            features: Precomputed features of the task description
 
-        # Check for filter keywords
-        filter_count = sum(1 for kw in self.context.FILTER_OUT_KEYWORDS if kw in description_lower)
+        Returns:
+            Filter score (0.0-1.0)
+        """
+        if features is None:
+            features = self._extract_features(task)
+        analysis = features.analysis
 
-        # Check for red flags
-        red_flag_count = sum(1 for flag in self.context.RED_FLAGS if flag in description_lower)
+        # Check for filter-out categories
+        if analysis.filter_category:
+            logger.debug("Filter category detected", category=analysis.filter_category)
+            return _FILTER_CATEGORY_SCORE
 
         # Calculate score
         base_score = 0.5
 
         # Positive signals
-        base_score += min(mapache_count * 0.1, 0.4)
+        base_score += min(analysis.mapache_count * 0.1, 0.4)
 
         # Negative signals
-        base_score -= filter_count * 0.2
-        base_score -= red_flag_count * 0.15
+        base_score -= analysis.filter_count * 0.2
+        base_score -= analysis.red_flag_count * 0.15
 
         # Check for project indicators
-        indicators = extract_project_indicators(description_lower)
-        base_score += len(indicators) * 0.05
+        base_score += len(features.indicators) * 0.05
 
         return max(0.0, min(1.0, base_score))
 
@@ -151,7 +322,8 @@ class ReasoningEngine:
         self,
         task: Task,
         existing_project: LinearProject,
-        similarity: float
+        similarity: float,
+        features: Optional[TaskFeatures] = None
     ) -> float:
         """
         Calculate duplicate score (0.0 = completely different, 1.0 = exact duplicate).
@@ -160,6 +332,7 @@ class ReasoningEngine:
             task: Task to evaluate
             existing_project: Existing project to compare
             similarity: Cosine similarity score
+            features: Precomputed features of the task description
 
         Returns:
             Duplicate score (0.0-1.0)
@@ -168,25 +341,24 @@ class ReasoningEngine:
         base_score = similarity
 
         # Check title/name similarity
-        task_keywords = set(extract_keywords(task.task_description))
-        project_keywords = set(extract_keywords(existing_project.name))
+        task_keywords = features.keywords if features else extract_keyword_set(task.task_description)
+        project_keywords = _project_keywords(existing_project.name, existing_project.description)
 
-        if existing_project.description:
-            project_keywords.update(extract_keywords(existing_project.description))
-
-        # Keyword overlap
+        # Keyword overlap (Jaccard, without building the union)
         if task_keywords and project_keywords:
-            overlap = len(task_keywords & project_keywords) / len(task_keywords | project_keywords)
+            shared = len(task_keywords & project_keywords)
+            overlap = shared / (len(task_keywords) + len(project_keywords) - shared)
             base_score = (base_score + overlap) / 2
 
         return base_score
 
-    def clarity_score(self, task: Task) -> float:
+    def clarity_score(self, task: Task, features: Optional[TaskFeatures] = None) -> float:
         """
         Calculate clarity score (0.0 = empty/nonsensical, 1.0 = clear with criteria).
 
         Args:
             task: Task to evaluate
+            features: Precomputed features of the task description
 
         Returns:
             Clarity score (0.0-1.0)
@@ -201,16 +373,8 @@ class ReasoningEngine:
         if is_empty_or_vague(description):
             return 0.3
 
-        # Check for clarity indicators
-        clarity_indicators = [
-            'implement', 'build', 'create', 'deploy', 'setup', 'configure',
-            'add', 'remove', 'update', 'fix', 'optimize', 'integrate'
-        ]
-        has_clarity = any(ind in description.lower() for ind in clarity_indicators)
-
-        # Check for vague indicators
-        vague_indicators = ['maybe', 'possibly', 'think about', 'consider', 'explore']
-        has_vague = any(ind in description.lower() for ind in vague_indicators)
+        if features is None:
+            features = self._extract_features(task)
 
         # Check length
         length_score = min(len(description) / 200, 1.0)  # Normalize to 200 chars
@@ -218,15 +382,13 @@ class ReasoningEngine:
         # Calculate final score
         base_score = length_score
 
-        if has_clarity:
+        if features.has_clarity:
             base_score += 0.3
-        if has_vague:
+        if features.has_vague:
             base_score -= 0.2
 
         # Check for details (acceptance criteria, technical terms)
-        technical_terms = ['api', 'database', 'service', 'endpoint', 'component', 'module']
-        has_technical = any(term in description.lower() for term in technical_terms)
-        if has_technical:
+        if features.has_technical:
             base_score += 0.1
 
         return max(0.0, min(1.0, base_score))
@@ -264,42 +426,115 @@ class ReasoningEngine:
     def _find_similar_projects(
         self,
         task_embedding: np.ndarray,
-        projects: List[LinearProject]
+        projects: List[LinearProject],
+        projects_matrix: Optional[QuantizedMatrix] = None,
+        threshold: float = SIMILARITY_THRESHOLD_MATCH
     ) -> List[Match]:
         """Find similar projects using embeddings."""
+        return self._find_similar_projects_batch(
+            [task_embedding], projects, projects_matrix, threshold
+        )[0]
+
+    def _find_similar_projects_batch(
+        self,
+        task_embeddings: List[np.ndarray],
+        projects: List[LinearProject],
+        projects_matrix: Optional[QuantizedMatrix] = None,
+        threshold: float = SIMILARITY_THRESHOLD_MATCH
+    ) -> List[List[Match]]:
+        """Find the top 5 similar projects for each task embedding."""
         if not projects:
-            return []
+            return [[] for _ in task_embeddings]
+
+        # Task embeddings enter the float32 pipeline here
+        queries = np.asarray(task_embeddings, dtype=np.float32)
+        if projects_matrix is not None:
+            # Rows already stacked and normalized
+            valid_projects = projects
+            scores = batch_scores_quantized(queries, projects_matrix)
+            self._rescore_borderline(scores, queries, valid_projects, threshold)
+        else:
+            valid_projects, matrix = self._embedding_matrix(projects)
+            if matrix is None:
+                return [[] for _ in task_embeddings]
+            scores = batch_scores_normalized(queries, matrix)
+
+        # One GEMM for the batch; top 5 per task
+        return [
+            [
+                Match(
+                    project=valid_projects[idx],
+                    similarity_score=score,
+                    match_reason=f"Semantic similarity: {score:.2f}"
+                )
+                for idx, score in row
+            ]
+            for row in top_matches(scores, threshold, k=5)
+        ]
 
-        # Get project embeddings
-        project_embeddings = []
-        valid_projects = []
+    @staticmethod
+    def _rescore_borderline(
+        scores: np.ndarray,
+        queries: np.ndarray,
+        projects: List[LinearProject],
+        threshold: float
+    ) -> None:
+        """
+        Replace int8 scores near the threshold with exact float32 ones, in place.
 
-        for project in projects:
-            if project.embedding:
-                project_embeddings.append(np.array(project.embedding))
-                valid_projects.append(project)
+        Quantization error is far below the margin, so only these few pairs
+        can land on the wrong side of the threshold.
+        """
+        rows, cols = np.nonzero(np.abs(scores - threshold) < QUANTIZED_RESCORE_MARGIN)
+        for row, col in zip(rows, cols):
+            vector = projects[col].embedding_vector()
+            if vector is not None:
+                scores[row, col] = cosine_similarity(queries[row], vector)
 
-        if not project_embeddings:
-            return []
+    def _embedding_matrix(
+        self,
+        projects: List[LinearProject]
+    ) -> Tuple[List[LinearProject], Optional[np.ndarray]]:
+        """
+        Get the projects that have embeddings and their normalized matrix.
 
-        # Find similar
-        similar_indices = find_most_similar(
-            task_embedding,
-            project_embeddings,
-            threshold=SIMILARITY_THRESHOLD_MATCH
-        )
+        The matrix is cached and reused while the same projects carry the
+        same embedding objects.
 
-        # Create matches
-        matches = []
-        for idx, score in similar_indices[:5]:  # Top 5
-            match = Match(
-                project=valid_projects[idx],
-                similarity_score=score,
-                match_reason=f"Semantic similarity: {score:.2f}"
-            )
-            matches.append(match)
+        Args:
+            projects: Candidate projects
 
-        return matches
+        Returns:
+            (projects with embeddings, matrix whose row i belongs to project i),
+            or ([], None) if no project has an embedding
+        """
+        valid_projects = [p for p in projects if p.has_embedding]
+        # Sources are kept referenced, so their identities stay unique
+        sources = [
+            p.embedding_bytes if p.embedding_bytes is not None else p.embedding
+            for p in valid_projects
+        ]
+
+        cached_projects, cached_sources, matrix = self._emb_cache
+        unchanged = (
+            len(sources) == len(cached_sources)
+            and all(a is b for a, b in zip(valid_projects, cached_projects))
+            and all(a is b for a, b in zip(sources, cached_sources))
+        )
+        if unchanged:
+            return cached_projects, matrix
+
+        matrix = None
+        if valid_projects:
+            # Fill one preallocated float32 buffer straight from each
+            # project's bytes or list, then normalize it in place
+            dim = len(valid_projects[0].embedding_vector())
+            matrix = np.empty((len(valid_projects), dim), dtype=np.float32)
+            for row, source in zip(matrix, sources):
+                row[:] = np.frombuffer(source, dtype=EMBEDDING_DTYPE) if isinstance(source, bytes) else source
+            matrix = normalize_rows(matrix)
+        self._emb_cache = (valid_projects, sources, matrix)
+        return valid_projects, matrix
 
     def _create_add_decision(
         self,
@@ -307,9 +542,11 @@ class ReasoningEngine:
         matches: List[Match],
         alignment_score: float,
         filter_score: float,
-        clarity_score: float
+        clarity_score: float,
+        features: TaskFeatures
     ) -> Decision:
         """Create ADD decision."""
+        analysis = features.analysis
         # Generate reasoning
         reasoning = f"This task aligns with mapache.app work (alignment: {alignment_score:.2f}). "
 
@@ -317,13 +554,12 @@ class ReasoningEngine:
             reasoning += f"Found {len(matches)} related project(s), but no strong duplicate. "
 
         # Determine tags
-        tags = self.context.get_tags(task.task_description)
+        tags = analysis.tags
 
         # Suggested action
-        domain = self.context.get_domain(task.task_description)
         action = f"Create new Linear project/issue"
-        if domain:
-            action += f" in domain: {domain}"
+        if analysis.domain:
+            action += f" in domain: {analysis.domain}"
 
         return Decision(
             decision=DecisionType.ADD,
@@ -335,9 +571,14 @@ class ReasoningEngine:
             mapped_project=matches[0].project.id if matches else None
         )
 
-    def _create_filter_decision(self, task: Task, filter_score: float) -> Decision:
+    def _create_filter_decision(
+        self,
+        task: Task,
+        filter_score: float,
+        analysis: AnalysisResult
+    ) -> Decision:
         """Create FILTER decision."""
-        filter_category = self.context.get_filter_category(task.task_description)
+        filter_category = analysis.filter_category
 
         reasoning = f"This task does not align with mapache.app work (score: {filter_score:.2f}). "
         if filter_category:
@@ -358,7 +599,8 @@ class ReasoningEngine:
         self,
         task: Task,
         matches: List[Match],
-        duplicate_score: float
+        duplicate_score: float,
+        features: TaskFeatures
     ) -> Decision:
         """Create CONSOLIDATE decision."""
         best_match = matches[0]
@@ -379,10 +621,15 @@ class ReasoningEngine:
             reasoning=reasoning,
             suggested_action=f"Link to existing project {best_match.project.id} instead of creating new",
             alignment_score=0.90,
-            tags=self.context.get_tags(task.task_description)
+            tags=features.analysis.tags
         )
 
-    def _create_clarify_decision(self, task: Task, clarity_score: float) -> Decision:
+    def _create_clarify_decision(
+        self,
+        task: Task,
+        clarity_score: float,
+        features: TaskFeatures
+    ) -> Decision:
         """Create CLARIFY decision."""
         reasoning = f"Task description needs clarification (clarity: {clarity_score:.2f}). "
 
@@ -391,11 +638,10 @@ class ReasoningEngine:
         if len(task.task_description) < 20:
             questions.append("Can you provide more details about what needs to be done?")
 
-        if not extract_keywords(task.task_description):
+        if not features.keywords:
             questions.append("What is the specific goal or expected outcome?")
 
-        domain = self.context.get_domain(task.task_description)
-        if not domain:
+        if not features.analysis.domain:
             questions.append(
                 "Which mapache.app component does this relate to? "
                 "(core platform, SaaS integration, intelligence features, or internal ops)"
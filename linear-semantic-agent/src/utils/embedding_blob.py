@@ -0,0 +1,18 @@
+"""
+Byte encoding for float32 embeddings stored as Firestore blobs.
+"""
+
+import numpy as np
+
+# Stored embeddings are big-endian float32, independent of host byte order
+EMBEDDING_DTYPE = ">f4"
+
+
+def encode_embedding(embedding: np.ndarray) -> bytes:
+    """Pack an embedding into a fixed-width big-endian float32 blob."""
+    return np.ascontiguousarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def decode_embedding(blob: bytes) -> np.ndarray:
+    """Unpack a blob written by encode_embedding into a native float32 array."""
+    return np.frombuffer(blob, dtype=EMBEDDING_DTYPE).astype(np.float32)
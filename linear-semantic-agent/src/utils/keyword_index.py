@@ -0,0 +1,82 @@
+"""
+One-pass multi-keyword matching over free text.
+"""
+
+import re
+from typing import Dict, Hashable, Iterable, List, Pattern, Set, Tuple
+
+
+def trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex matching any of keywords, factored into a character trie.
+
+    A flat alternation makes the regex engine try every keyword at every
+    position of the text; the trie form costs one character test per
+    position that can't start a keyword. Each optional group is greedy
+    and sibling branches start with distinct characters, so the match at
+    a position is the longest keyword starting there.
+    """
+    trie: Dict[str, dict] = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}  # End of keyword
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+def compile_keywords(keywords: Iterable[str]) -> Pattern[str]:
+    """Compile keywords into one case-insensitive substring matcher."""
+    return re.compile(trie_pattern(keywords), re.IGNORECASE)
+
+
+class KeywordIndex:
+    """
+    Reverse index from keywords to labels, matched in one pass.
+
+    A single case-insensitive trie regex reports the longest keyword
+    starting at each position; attaching each keyword's shorter prefixes
+    recovers every keyword starting there, so overlapping keywords are all
+    found without one scan per keyword. Text with no keyword costs a
+    single search call.
+    """
+
+    def __init__(self, buckets: List[Tuple[Hashable, Iterable[str]]]):
+        """
+        Build the index.
+
+        Args:
+            buckets: (label, keywords) pairs; a keyword may carry several labels
+        """
+        self._labels: Dict[str, Set] = {}
+        for label, keywords in buckets:
+            for kw in keywords:
+                self._labels.setdefault(kw.lower(), set()).add(label)
+
+        self._prefixes: Dict[str, List[str]] = {
+            kw: [other for other in self._labels if kw.startswith(other)]
+            for kw in self._labels
+        }
+        self._pattern = compile_keywords(list(self._labels))
+
+    def counts(self, text: str) -> Dict[Hashable, int]:
+        """Count the distinct keywords of each label present in text."""
+        matched: Set[str] = set()
+        m = self._pattern.search(text)
+        while m is not None:
+            matched.update(self._prefixes[m.group().lower()])
+            m = self._pattern.search(text, m.start() + 1)
+
+        counts: Dict[Hashable, int] = {}
+        for keyword in matched:
+            for label in self._labels[keyword]:
+                counts[label] = counts.get(label, 0) + 1
+        return counts
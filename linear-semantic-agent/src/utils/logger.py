@@ -3,9 +3,17 @@ Structured logging configuration.
 """
 
 import logging
+import random
+import orjson
 import structlog
 from typing import Any, Dict
 from src.config.settings import settings
+from src.config.constants import LOG_TRACEBACK_SAMPLE_RATE
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer: orjson encoding, as str for stdlib handlers."""
+    return orjson.dumps(obj, **kwargs).decode("utf-8")
 
 
 def configure_logging():
@@ -26,10 +34,12 @@ def configure_logging():
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
+                structlog.processors.JSONRenderer(serializer=_orjson_dumps)
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
+            # Calls below log_level return immediately, before any processor
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
             cache_logger_on_first_use=True,
         )
     else:
@@ -59,6 +69,19 @@ def get_logger(name: str):
         return logging.getLogger(name)
 
 
+def sample_exc_info() -> bool:
+    """
+    Decide whether a logged request-path error should carry a traceback.
+
+    Formatting a traceback walks every frame, which adds up under error
+    storms, so only a sample of errors get one (all of them in debug).
+
+    Returns:
+        Value for the exc_info argument of a logging call
+    """
+    return settings.debug or random.random() < LOG_TRACEBACK_SAMPLE_RATE
+
+
 class LoggerMixin:
     """Mixin to add logging capabilities to a class."""
 
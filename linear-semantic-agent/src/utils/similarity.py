@@ -2,22 +2,30 @@
 Similarity matching utilities using cosine similarity.
 """
 
+import math
 import numpy as np
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
 from src.config.constants import (
     SIMILARITY_THRESHOLD_MATCH,
     SIMILARITY_THRESHOLD_DUPLICATE,
-    SIMILARITY_THRESHOLD_EXACT
+    SIMILARITY_THRESHOLD_EXACT,
+    QUANTIZED_BLOCK_ROWS
 )
 
 
-def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
+def cosine_similarity(
+    vec1: np.ndarray,
+    vec2: np.ndarray,
+    assume_normalized: bool = False
+) -> float:
     """
     Calculate cosine similarity between two vectors.
 
     Args:
         vec1: First embedding vector
         vec2: Second embedding vector
+        assume_normalized: Both vectors are already unit length; skip the norms
 
     Returns:
         Similarity score between 0.0 and 1.0
@@ -25,50 +33,422 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     if vec1 is None or vec2 is None:
         return 0.0
 
+    # Embeddings are float32 throughout; no-op for float32 arrays
+    vec1 = np.asarray(vec1, dtype=np.float32)
+    vec2 = np.asarray(vec2, dtype=np.float32)
+
     if len(vec1) == 0 or len(vec2) == 0:
         return 0.0
 
-    # Normalize vectors
-    vec1_norm = vec1 / (np.linalg.norm(vec1) + 1e-10)
-    vec2_norm = vec2 / (np.linalg.norm(vec2) + 1e-10)
-
-    # Compute cosine similarity
-    similarity = np.dot(vec1_norm, vec2_norm)
+    # Three dot products and one sqrt, without normalized copies
+    dot = float(vec1 @ vec2)
+    if not assume_normalized:
+        norms = float(vec1 @ vec1) * float(vec2 @ vec2)
+        if norms <= 0.0:
+            return 0.0
+        dot /= math.sqrt(norms)
 
     # Clip to [0, 1] range
-    return float(np.clip(similarity, 0.0, 1.0))
+    return max(0.0, min(1.0, dot))
+
+
+def cosine_similarity_matrix(queries: List[np.ndarray], candidates: List[np.ndarray]) -> np.ndarray:
+    """
+    Calculate cosine similarity between every query and every candidate.
+
+    Args:
+        queries: Query vectors of equal dimension
+        candidates: Candidate vectors of the same dimension
+
+    Returns:
+        Matrix of shape (len(queries), len(candidates)) with scores between
+        0.0 and 1.0, matching cosine_similarity pairwise
+    """
+    queries = normalize_rows(np.array(queries, dtype=np.float32))
+    candidates = np.asarray(candidates, dtype=np.float32)
+    # Squared norms in one pass, instead of writing a normalized copy of
+    # every candidate; the few scores are divided instead
+    norms = np.sqrt(np.einsum("ij,ij->i", candidates, candidates))
+    norms += 1e-10
+    # Divide and clip to [0, 1] (as cosine_similarity does) in place
+    scores = queries @ candidates.T
+    scores /= norms
+    return np.clip(scores, 0.0, 1.0, out=scores)
+
+
+def _ranked_above(
+    scores: np.ndarray,
+    threshold: float,
+    top_k: Optional[int] = None
+) -> np.ndarray:
+    """
+    Indices of scores at or above threshold, best first.
+
+    With top_k, the best k are selected by partition (O(N)) and only those
+    are sorted.
+    """
+    indices = np.flatnonzero(scores >= threshold)
+    if top_k is not None and len(indices) > top_k:
+        indices = indices[np.argpartition(-scores[indices], top_k - 1)[:top_k]]
+    return indices[np.argsort(-scores[indices], kind="stable")]
+
+
+def _gather_candidates(
+    candidate_embeddings: Union[List[np.ndarray], np.ndarray]
+) -> Tuple[Sequence[int], Union[List[np.ndarray], np.ndarray]]:
+    """Get (original positions, candidates) with None entries of a list dropped."""
+    if isinstance(candidate_embeddings, np.ndarray):
+        # Already contiguous; no per-candidate gather
+        return range(len(candidate_embeddings)), candidate_embeddings
+    positions = [idx for idx, candidate in enumerate(candidate_embeddings) if candidate is not None]
+    return positions, [candidate_embeddings[idx] for idx in positions]
 
 
 def find_most_similar(
     query_embedding: np.ndarray,
-    candidate_embeddings: List[np.ndarray],
-    threshold: float = SIMILARITY_THRESHOLD_MATCH
+    candidate_embeddings: Union[List[np.ndarray], np.ndarray],
+    threshold: float = SIMILARITY_THRESHOLD_MATCH,
+    top_k: Optional[int] = None,
+    pre_normalized: bool = False
 ) -> List[Tuple[int, float]]:
     """
     Find most similar embeddings above threshold.
 
     Args:
         query_embedding: Query vector
-        candidate_embeddings: List of candidate vectors
+        candidate_embeddings: List of candidate vectors (None entries are
+            skipped), or one (N, D) matrix with a candidate per row
         threshold: Minimum similarity threshold
+        top_k: Keep only the best top_k matches (default: all)
+        pre_normalized: Candidates are already unit length (see normalize);
+            skip their norms
 
     Returns:
         List of (index, similarity_score) tuples, sorted by score descending
     """
-    if query_embedding is None or not candidate_embeddings:
+    if query_embedding is None or len(candidate_embeddings) == 0:
+        return []
+
+    positions, candidates = _gather_candidates(candidate_embeddings)
+    if len(positions) == 0:
+        return []
+
+    # Score every candidate with one matrix-vector product
+    if pre_normalized:
+        # Clip to [0, 1] range, as cosine_similarity does
+        scores = np.asarray(candidates, dtype=np.float32) @ normalize(query_embedding)
+        np.clip(scores, 0.0, 1.0, out=scores)
+    else:
+        scores = cosine_similarity_matrix([query_embedding], candidates)[0]
+    rows = _ranked_above(scores, threshold, top_k)
+
+    return [(positions[row], float(scores[row])) for row in rows]
+
+
+def find_most_similar_batch(
+    query_embeddings: Union[List[np.ndarray], np.ndarray],
+    candidate_embeddings: Union[List[np.ndarray], np.ndarray],
+    threshold: float = SIMILARITY_THRESHOLD_MATCH,
+    top_k: Optional[int] = None
+) -> List[List[Tuple[int, float]]]:
+    """
+    Run find_most_similar for many queries with one matrix multiply.
+
+    Args:
+        query_embeddings: Query vectors, or a (B, D) matrix
+        candidate_embeddings: As for find_most_similar
+        threshold: Minimum similarity threshold
+        top_k: Keep only the best top_k matches per query (default: all)
+
+    Returns:
+        Per query, list of (index, similarity_score) tuples sorted by score
+        descending
+    """
+    if len(query_embeddings) == 0:
+        return []
+
+    positions, candidates = _gather_candidates(candidate_embeddings)
+    if len(positions) == 0:
+        return [[] for _ in range(len(query_embeddings))]
+
+    scores = cosine_similarity_matrix(query_embeddings, candidates)
+    k = len(positions) if top_k is None else top_k
+
+    return [
+        [(positions[col], score) for col, score in row]
+        for row in top_matches(scores, threshold, k)
+    ]
+
+
+def normalize(vector: np.ndarray) -> np.ndarray:
+    """
+    Scale an embedding to unit length, as float32.
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        Unit-length copy of vector
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / (np.linalg.norm(vector) + 1e-10)
+
+
+def normalize_rows(embeddings: List[np.ndarray]) -> np.ndarray:
+    """
+    Stack embeddings into a contiguous, L2-normalized float32 matrix.
+
+    Args:
+        embeddings: List of embedding vectors of equal dimension
+
+    Returns:
+        Matrix of shape (N, D) with unit-length rows
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-10
+    return matrix
+
+
+def find_most_similar_normalized(
+    query_embedding: np.ndarray,
+    normalized_matrix: np.ndarray,
+    threshold: float = SIMILARITY_THRESHOLD_MATCH,
+    top_k: Optional[int] = None
+) -> List[Tuple[int, float]]:
+    """
+    Find most similar rows of a pre-normalized matrix (see normalize_rows).
+
+    Same as find_most_similar(..., pre_normalized=True).
+
+    Args:
+        query_embedding: Query vector
+        normalized_matrix: Candidate matrix with unit-length rows
+        threshold: Minimum similarity threshold
+        top_k: Keep only the best top_k matches (default: all)
+
+    Returns:
+        List of (row_index, similarity_score) tuples, sorted by score descending
+    """
+    if normalized_matrix is None:
+        return []
+    return find_most_similar(
+        query_embedding, normalized_matrix, threshold, top_k, pre_normalized=True
+    )
+
+
+class QuantizedMatrix(NamedTuple):
+    """Int8-quantized matrix rows with per-row dequantization scales."""
+
+    values: np.ndarray  # (N, D) int8
+    scales: np.ndarray  # (N,) float32
+
+
+def quantize_rows(matrix: np.ndarray) -> QuantizedMatrix:
+    """
+    Quantize matrix rows to int8 with a symmetric per-row scale.
+
+    Args:
+        matrix: Float matrix of shape (N, D)
+
+    Returns:
+        QuantizedMatrix where values * scales[:, None] approximates matrix
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    values = np.round(matrix / scales[:, None]).astype(np.int8)
+    return QuantizedMatrix(values=values, scales=scales.astype(np.float32))
+
+
+def quantize_vector(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantize one vector to int8 with a symmetric scale (see quantize_rows).
+
+    Args:
+        vector: Float vector
+
+    Returns:
+        (int8 vector, scale) where values * scale approximates vector
+    """
+    quantized = quantize_rows(np.asarray(vector, dtype=np.float32)[None, :])
+    return quantized.values[0], float(quantized.scales[0])
+
+
+def stack_quantized_rows(rows: List[Tuple[np.ndarray, float]]) -> QuantizedMatrix:
+    """
+    Stack individually quantized rows into one matrix.
+
+    Args:
+        rows: (int8 vector, scale) pairs of equal dimension
+
+    Returns:
+        QuantizedMatrix with one row per pair
+    """
+    values, scales = zip(*rows)
+    return QuantizedMatrix(values=np.stack(values), scales=np.asarray(scales, dtype=np.float32))
+
+
+@lru_cache(maxsize=None)
+def _int8_accumulator(dim: int) -> type:
+    """
+    Pick the float dtype that accumulates int8 dot products of length dim exactly.
+
+    Float matmul goes through BLAS while integer matmul does not. Every
+    partial sum is an integer bounded by dim * 127**2, so float32 is exact
+    up to 2**24 (dim <= 1040); larger dimensions fall back to float64.
+    """
+    return np.float32 if dim * 127 * 127 < 2 ** 24 else np.float64
+
+
+def _int8_dots(queries: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Exact dot products of int8 queries (B, D) with int8 rows (N, D).
+
+    numpy has no int8 GEMM, so rows are widened to a float dtype that stays
+    exact (see _int8_accumulator). Widening a block of rows at a time keeps
+    the float copy in cache instead of materializing all N rows.
+
+    Returns:
+        Matrix of shape (B, N)
+    """
+    acc = _int8_accumulator(values.shape[1])
+    queries = queries.astype(acc).T
+    # (N, B) so each block writes a contiguous slice
+    dots = np.empty((len(values), queries.shape[1]), dtype=acc)
+    for start in range(0, len(values), QUANTIZED_BLOCK_ROWS):
+        end = start + QUANTIZED_BLOCK_ROWS
+        np.matmul(values[start:end].astype(acc), queries, out=dots[start:end])
+    return dots.T
+
+
+def find_most_similar_quantized(
+    query_embedding: np.ndarray,
+    quantized: QuantizedMatrix,
+    threshold: float = SIMILARITY_THRESHOLD_MATCH,
+    top_k: Optional[int] = None
+) -> List[Tuple[int, float]]:
+    """
+    Find most similar rows of a quantized, pre-normalized matrix.
+
+    The query is normalized and quantized the same way, dot products are
+    accumulated exactly and rescaled to approximate cosine similarity.
+
+    Args:
+        query_embedding: Query vector
+        quantized: quantize_rows(normalize_rows(...)) of the candidates
+        threshold: Minimum similarity threshold
+        top_k: Keep only the best top_k matches (default: all)
+
+    Returns:
+        List of (row_index, similarity_score) tuples, sorted by score descending
+    """
+    if query_embedding is None or quantized is None or len(quantized.values) == 0:
         return []
 
-    similarities = []
-    for idx, candidate in enumerate(candidate_embeddings):
-        if candidate is not None:
-            score = cosine_similarity(query_embedding, candidate)
-            if score >= threshold:
-                similarities.append((idx, score))
+    query_values, query_scale = quantize_vector(normalize(query_embedding))
+
+    dots = _int8_dots(query_values[None, :], quantized.values)[0]
+    scores = dots * (quantized.scales * np.float32(query_scale))
+
+    indices = _ranked_above(scores, threshold, top_k)
+
+    return [(int(i), min(float(scores[i]), 1.0)) for i in indices]
 
-    # Sort by score descending
-    similarities.sort(key=lambda x: x[1], reverse=True)
 
-    return similarities
+def batch_scores_normalized(queries: np.ndarray, normalized_matrix: np.ndarray) -> np.ndarray:
+    """
+    Score a batch of queries against a pre-normalized matrix in one GEMM.
+
+    Args:
+        queries: Query matrix of shape (B, D)
+        normalized_matrix: Candidate matrix of shape (N, D) with unit-length rows
+
+    Returns:
+        Cosine similarity matrix of shape (B, N)
+    """
+    return normalize_rows(np.array(queries, dtype=np.float32)) @ normalized_matrix.T
+
+
+def batch_scores_quantized(queries: np.ndarray, quantized: QuantizedMatrix) -> np.ndarray:
+    """
+    Score a batch of queries against a quantized, pre-normalized matrix.
+
+    Queries are normalized and quantized the way find_most_similar_quantized
+    does for one query, so each row of the result matches it.
+
+    Args:
+        queries: Query matrix of shape (B, D)
+        quantized: quantize_rows(normalize_rows(...)) of the candidates
+
+    Returns:
+        Approximate cosine similarity matrix of shape (B, N)
+    """
+    queries_q = quantize_rows(normalize_rows(np.array(queries, dtype=np.float32)))
+    dots = _int8_dots(queries_q.values, quantized.values)
+    return dots * (queries_q.scales[:, None] * quantized.scales[None, :])
+
+
+def top_matches(
+    scores: np.ndarray,
+    threshold: float = SIMILARITY_THRESHOLD_MATCH,
+    k: int = 5
+) -> List[List[Tuple[int, float]]]:
+    """
+    Select each row's best-scoring columns above threshold.
+
+    Args:
+        scores: Similarity matrix of shape (B, N)
+        threshold: Minimum similarity threshold
+        k: Maximum matches per row
+
+    Returns:
+        Per row, up to k (column_index, similarity_score) tuples sorted by
+        score descending
+    """
+    scores = np.asarray(scores)
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return [[] for _ in range(len(scores))]
+
+    # Partition, sort and threshold every row at once rather than per row
+    if k < scores.shape[1]:
+        columns = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        columns = np.broadcast_to(np.arange(k), scores.shape)
+    picked = np.take_along_axis(scores, columns, axis=1)
+    # Best first; ties keep column order, as _ranked_above does
+    order = np.lexsort((columns, -picked), axis=1)
+    columns = np.take_along_axis(columns, order, axis=1).tolist()
+    picked = np.take_along_axis(picked, order, axis=1)
+    counts = (picked >= threshold).sum(axis=1).tolist()
+    picked = np.minimum(picked, 1.0).tolist()
+
+    return [
+        list(zip(row_columns[:count], row_scores[:count]))
+        for row_columns, row_scores, count in zip(columns, picked, counts)
+    ]
+
+
+# Ascending thresholds; classify() counts how many a score reaches
+_THRESHOLDS = np.array([
+    SIMILARITY_THRESHOLD_MATCH,
+    SIMILARITY_THRESHOLD_DUPLICATE,
+    SIMILARITY_THRESHOLD_EXACT
+])
+
+
+def classify(similarity_scores: np.ndarray) -> np.ndarray:
+    """
+    Classify many similarity scores at once.
+
+    Args:
+        similarity_scores: Array of cosine similarities
+
+    Returns:
+        uint8 array of the same shape: 0 unrelated, 1 related (is_related),
+        2 duplicate (is_duplicate), 3 exact duplicate (is_exact_duplicate)
+    """
+    return np.searchsorted(_THRESHOLDS, similarity_scores, side="right").astype(np.uint8)
 
 
 def is_duplicate(similarity_score: float) -> bool:
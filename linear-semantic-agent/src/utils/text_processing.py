@@ -3,7 +3,38 @@ Text normalization and processing utilities.
 """
 
 import re
-from typing import List, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+
+from src.utils.keyword_index import KeywordIndex
+
+_WORD_RE = re.compile(r'\b\w+\b')
+_MD_CHARS = str.maketrans('', '', '#*`_~')
+_URL_RE = re.compile(r'https?://\S+')
+_VAGUE_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r'^(thing|stuff|fix|improve|update)s?\s*$',
+        r'^(untitled|tbd|todo)$',
+        r'^\s*$'
+    ]
+]
+
+_STOP_WORDS = frozenset({
+    'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but',
+    'in', 'with', 'to', 'for', 'of', 'as', 'by', 'this', 'that',
+    'from', 'be', 'are', 'was', 'were', 'been', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'could', 'should'
+})
+
+# Terms suggesting a project (vs personal task), by category
+PROJECT_INDICATORS: Dict[str, List[str]] = {
+    'technical': ['api', 'server', 'database', 'deployment', 'integration', 'sdk', 'framework'],
+    'business': ['customer', 'user', 'revenue', 'product', 'feature', 'requirement'],
+    'development': ['implement', 'build', 'create', 'develop', 'deploy', 'setup', 'configure'],
+    'architecture': ['system', 'architecture', 'design', 'component', 'service', 'infrastructure']
+}
+_PROJECT_INDICATORS = KeywordIndex(list(PROJECT_INDICATORS.items()))
 
 
 def normalize_text(text: str) -> str:
@@ -19,53 +50,49 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Convert to lowercase
-    text = text.lower()
+    # Lowercase, collapse whitespace runs and strip the ends; split() with
+    # no separator does the last two in C
+    return ' '.join(text.lower().split())
 
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
 
-    # Strip leading/trailing whitespace
-    text = text.strip()
-
-    return text
-
-
-def extract_keywords(text: str, min_length: int = 3) -> List[str]:
+@lru_cache(maxsize=4096)
+def extract_keywords(text: str, min_length: int = 3) -> Tuple[str, ...]:
     """
     Extract keywords from text.
 
+    Memoized per text: the same task description and project names are
+    keyworded repeatedly within one evaluation.
+
     Args:
         text: Input text
         min_length: Minimum keyword length
 
     Returns:
-        List of keywords
+        Tuple of keywords, in order of appearance
     """
     if not text:
-        return []
-
-    # Normalize
-    text = normalize_text(text)
-
-    # Remove common stop words
-    stop_words = {
-        'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but',
-        'in', 'with', 'to', 'for', 'of', 'as', 'by', 'this', 'that',
-        'from', 'be', 'are', 'was', 'were', 'been', 'have', 'has', 'had',
-        'do', 'does', 'did', 'will', 'would', 'could', 'should'
-    }
-
-    # Split into words
-    words = re.findall(r'\b\w+\b', text)
-
-    # Filter keywords
-    keywords = [
-        word for word in words
-        if len(word) >= min_length and word not in stop_words
-    ]
+        return ()
+
+    # Word matching already skips whitespace, so lowercasing is all the
+    # normalization needed
+    return tuple(
+        word for word in _WORD_RE.findall(text.lower())
+        if len(word) >= min_length and word not in _STOP_WORDS
+    )
 
-    return keywords
+
+@lru_cache(maxsize=4096)
+def extract_keyword_set(text: str) -> FrozenSet[str]:
+    """
+    Extract the distinct keywords of text, for set comparisons.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Frozenset of keywords
+    """
+    return frozenset(extract_keywords(text))
 
 
 def is_empty_or_vague(text: str) -> bool:
@@ -81,16 +108,10 @@ def is_empty_or_vague(text: str) -> bool:
     if not text or len(text.strip()) < 10:
         return True
 
-    vague_patterns = [
-        r'^(thing|stuff|fix|improve|update)s?\s*$',
-        r'^(untitled|tbd|todo)$',
-        r'^\s*$'
-    ]
-
     normalized = normalize_text(text)
 
-    for pattern in vague_patterns:
-        if re.match(pattern, normalized, re.IGNORECASE):
+    for pattern in _VAGUE_RES:
+        if pattern.match(normalized):
             return True
 
     return False
@@ -110,18 +131,14 @@ def clean_description(text: str) -> str:
         return ""
 
     # Remove markdown
-    text = re.sub(r'[#*`_~]', '', text)
-
-    # Remove URLs
-    text = re.sub(r'https?://\S+', '', text)
-
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = text.translate(_MD_CHARS)
 
-    # Strip
-    text = text.strip()
+    # Remove URLs (skipping the regex when there can't be any)
+    if 'http' in text:
+        text = _URL_RE.sub('', text)
 
-    return text
+    # Collapse whitespace and strip
+    return ' '.join(text.split())
 
 
 def truncate_text(text: str, max_length: int = 500) -> str:
@@ -144,7 +161,8 @@ def truncate_text(text: str, max_length: int = 500) -> str:
     return text[:max_length-3] + "..."
 
 
-def extract_project_indicators(text: str) -> Set[str]:
+@lru_cache(maxsize=4096)
+def extract_project_indicators(text: str) -> FrozenSet[str]:
     """
     Extract indicators that suggest this is a project (vs personal task).
 
@@ -154,20 +172,4 @@ def extract_project_indicators(text: str) -> Set[str]:
     Returns:
         Set of project indicators found
     """
-    indicators = {
-        'technical': ['api', 'server', 'database', 'deployment', 'integration', 'sdk', 'framework'],
-        'business': ['customer', 'user', 'revenue', 'product', 'feature', 'requirement'],
-        'development': ['implement', 'build', 'create', 'develop', 'deploy', 'setup', 'configure'],
-        'architecture': ['system', 'architecture', 'design', 'component', 'service', 'infrastructure']
-    }
-
-    text_lower = text.lower()
-    found_indicators = set()
-
-    for category, terms in indicators.items():
-        for term in terms:
-            if term in text_lower:
-                found_indicators.add(category)
-                break
-
-    return found_indicators
+    return frozenset(_PROJECT_INDICATORS.counts(text))
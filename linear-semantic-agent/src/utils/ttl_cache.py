@@ -0,0 +1,73 @@
+"""
+Time-bounded memoization for coroutine functions.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def async_ttl_cache(seconds: float) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Memoize a coroutine function's result for a fixed time.
+
+    Results are keyed on the positional and keyword arguments (including
+    self for methods). Concurrent callers with the same key share a single
+    in-flight call rather than each issuing their own; exceptions are not
+    cached.
+
+    Args:
+        seconds: How long a result stays fresh (monotonic clock)
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        entries: Dict[Hashable, Tuple[float, Any]] = {}
+        # Per-key lock and the number of callers using it; dropped once
+        # unused so no lock outlives the event loop it was bound to
+        locks: Dict[Hashable, List[Any]] = {}
+
+        def fresh(key: Hashable) -> Optional[Tuple[float, Any]]:
+            """Get key's unexpired entry, evicting it if expired."""
+            entry = entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del entries[key]
+                entry = None
+            return entry
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = fresh(key)
+            if entry is not None:
+                return entry[1]
+
+            holder = locks.setdefault(key, [asyncio.Lock(), 0])
+            holder[1] += 1
+            try:
+                async with holder[0]:
+                    # Another caller may have refreshed it while we waited
+                    entry = fresh(key)
+                    if entry is not None:
+                        return entry[1]
+                    result = await func(*args, **kwargs)
+                    entries[key] = (time.monotonic() + seconds, result)
+                    return result
+            finally:
+                holder[1] -= 1
+                if holder[1] == 0 and locks.get(key) is holder:
+                    del locks[key]
+
+        def cache_clear() -> None:
+            """Drop all memoized results and idle locks."""
+            entries.clear()
+            locks.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,150 @@
+"""
+Tests for one-pass keyword matching against a plain substring scan.
+"""
+
+import random
+
+import pytest
+from src.models.mapache_context import MapacheContext, _TECH_TAGS
+from src.utils.keyword_index import KeywordIndex
+from src.utils.text_processing import PROJECT_INDICATORS, extract_project_indicators
+
+# Keywords nested in one another or sharing a prefix
+OVERLAPPING_BUCKETS = [
+    ("tech", ["agent", "agents", "sub-agent", "api", "apis", "gen"]),
+    ("plural", ["agents", "apis"]),
+    ("short", ["a", "ap", "age"]),
+]
+
+OVERLAPPING_TEXTS = [
+    "",
+    "no keywords here",
+    "agent",
+    "AGENTS",
+    "sub-agents for the apis",
+    "Rapid API gateway",
+    "apiapis agentagents",
+    "page",
+    "Sub-Agent orchestration via public APIs and agent SDKs",
+]
+
+
+def _substring_counts(buckets, text):
+    """Count each label's distinct keywords found by scanning for each one."""
+    lowered = text.lower()
+    found = {}
+    for label, keywords in buckets:
+        found.setdefault(label, set()).update(kw.lower() for kw in keywords if kw.lower() in lowered)
+    return {label: len(keywords) for label, keywords in found.items() if keywords}
+
+
+def _any_keyword(keywords, text):
+    """Whether any keyword occurs in text, case-insensitively."""
+    lowered = text.lower()
+    return any(kw.lower() in lowered for kw in keywords)
+
+
+def _random_texts(count, seed):
+    """Descriptions stitched from keyword fragments, filler words and mixed case."""
+    rng = random.Random(seed)
+    vocabulary = (
+        [kw for _, kws in OVERLAPPING_BUCKETS for kw in kws]
+        + MapacheContext.MAPACHE_KEYWORDS
+        + MapacheContext.FILTER_OUT_KEYWORDS
+        + MapacheContext.RED_FLAGS
+        + [kw for kws in MapacheContext.VALID_DOMAINS.values() for kw in kws]
+        + [kw for kws in MapacheContext.FILTER_OUT_RULES.values() for kw in kws]
+        + [kw for kws in PROJECT_INDICATORS.values() for kw in kws]
+        + ["the", "for", "with", "s", "ing", "-", " ", "x"]
+    )
+    texts = []
+    for _ in range(count):
+        pieces = []
+        for _ in range(rng.randint(0, 8)):
+            piece = rng.choice(vocabulary)
+            if rng.random() < 0.3:
+                # Cut keywords apart so partial matches are exercised
+                cut = rng.randint(0, len(piece))
+                piece = piece[:cut] if rng.random() < 0.5 else piece[cut:]
+            pieces.append(piece.upper() if rng.random() < 0.2 else piece)
+        texts.append(rng.choice(["", " "]).join(pieces))
+    return texts
+
+
+RANDOM_TEXTS = _random_texts(500, seed=13)
+
+
+class TestKeywordIndex:
+    """Tests for KeywordIndex.counts."""
+
+    @pytest.mark.parametrize("text", OVERLAPPING_TEXTS)
+    def test_overlapping_keywords(self, text):
+        """Test nested and prefix-sharing keywords are each counted once."""
+        index = KeywordIndex(OVERLAPPING_BUCKETS)
+        assert index.counts(text) == _substring_counts(OVERLAPPING_BUCKETS, text)
+
+    def test_matches_substring_scan(self):
+        """Test randomized descriptions against a per-keyword substring scan."""
+        index = KeywordIndex(OVERLAPPING_BUCKETS)
+        for text in RANDOM_TEXTS:
+            assert index.counts(text) == _substring_counts(OVERLAPPING_BUCKETS, text), text
+
+
+class TestKeywordCallers:
+    """Tests for the context and text helpers built on KeywordIndex."""
+
+    def test_analyze(self):
+        """Test analyze() against substring scans of each keyword bucket."""
+        for text in OVERLAPPING_TEXTS + RANDOM_TEXTS:
+            result = MapacheContext.analyze(text)
+
+            domain = next(
+                (d for d, kws in MapacheContext.VALID_DOMAINS.items() if _any_keyword(kws, text)),
+                None
+            )
+            filter_category = next(
+                (c for c, kws in MapacheContext.FILTER_OUT_RULES.items() if _any_keyword(kws, text)),
+                None
+            )
+            counts = _substring_counts(
+                [
+                    ("mapache", MapacheContext.MAPACHE_KEYWORDS),
+                    ("filter", MapacheContext.FILTER_OUT_KEYWORDS),
+                    ("redflag", MapacheContext.RED_FLAGS),
+                ],
+                text
+            )
+
+            assert result.domain == domain, text
+            assert result.filter_category == filter_category, text
+            assert result.mapache_count == counts.get("mapache", 0), text
+            assert result.filter_count == counts.get("filter", 0), text
+            assert result.red_flag_count == counts.get("redflag", 0), text
+            assert result.is_valid == MapacheContext.is_valid_mapache_work(text), text
+            assert result.confidence_modifier == MapacheContext.get_confidence_modifier(text), text
+            assert set(result.tags) == set(MapacheContext.get_tags(text)), text
+
+    def test_get_tags(self):
+        """Test get_tags against substring scans of each tag and domain."""
+        for text in OVERLAPPING_TEXTS + RANDOM_TEXTS:
+            expected = {tag for tag, kws in _TECH_TAGS.items() if _any_keyword(kws, text)}
+            domain = next(
+                (d for d, kws in MapacheContext.VALID_DOMAINS.items() if _any_keyword(kws, text)),
+                None
+            )
+            if domain:
+                expected.add(domain)
+
+            assert set(MapacheContext.get_tags(text)) == expected, text
+
+    def test_extract_project_indicators(self):
+        """Test extract_project_indicators against a substring scan per category."""
+        for text in OVERLAPPING_TEXTS + RANDOM_TEXTS:
+            expected = {
+                category for category, kws in PROJECT_INDICATORS.items() if _any_keyword(kws, text)
+            }
+            assert extract_project_indicators(text) == expected, text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
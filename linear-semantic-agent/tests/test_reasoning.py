@@ -2,10 +2,40 @@
 Tests for semantic reasoning engine.
 """
 
+import asyncio
+
+import numpy as np
 import pytest
+from src.tools import reasoning
 from src.tools.reasoning import ReasoningEngine
 from src.models.task import Task
+from src.models.project import LinearProject
 from src.models.decision import DecisionType
+from src.config.constants import QUANTIZED_RESCORE_MARGIN, SIMILARITY_THRESHOLD_MATCH
+from src.utils.similarity import batch_scores_quantized, cosine_similarity, stack_quantized_rows
+
+# Topics the test projects and task embeddings cluster around
+PROJECT_TOPICS = [
+    "Slack MCP server",
+    "Linear semantic agent",
+    "Firestore embedding cache",
+    "A2A protocol gateway",
+]
+
+# Descriptions covering every decision path, including the blank and
+# filter-category early exits
+BATCH_DESCRIPTIONS = [
+    "Build Slack MCP server integration for mapache.app",
+    "",
+    "Buy curtain rods and door covers",
+    "Implement semantic gap detection in Linear agent using Vertex AI embeddings "
+    "and Firestore caching with 0.75 threshold",
+    "Learn Temporal.io workflow orchestration",
+    "Add OAuth token refresh to the A2A protocol gateway for SaaS integrations",
+    "   ",
+    "Fix stuff",
+    "Cache project embeddings in Firestore for the mapache.app agent",
+]
 
 
 @pytest.fixture
@@ -14,6 +44,36 @@ def reasoning_engine():
     return ReasoningEngine()
 
 
+def _batch_fixture(dim: int = 64, seed: int = 7):
+    """Tasks, task embeddings and projects clustered around shared topics."""
+    rng = np.random.default_rng(seed)
+    topics = rng.standard_normal((len(PROJECT_TOPICS), dim))
+    projects = [
+        LinearProject(
+            id=f"PRJ-{i}",
+            name=PROJECT_TOPICS[i % 4],
+            description=f"Build {PROJECT_TOPICS[i % 4]} for mapache.app",
+            embedding=(topics[i % 4] + (0.1, 0.4, 0.8)[i % 3] * rng.standard_normal(dim)).tolist()
+        )
+        for i in range(12)
+    ]
+    tasks = [
+        Task(task_id=f"TEST-{300 + i}", task_description=description, source="linear")
+        for i, description in enumerate(BATCH_DESCRIPTIONS)
+    ]
+    embeddings = [topics[i % 4] + 0.3 * rng.standard_normal(dim) for i in range(len(tasks))]
+    return tasks, embeddings, projects
+
+
+def _assert_same_decision(decision, expected):
+    """Assert two decisions agree on everything but their timestamps."""
+    actual_fields = decision.model_dump(exclude={"created_at", "confidence", "alignment_score"})
+    expected_fields = expected.model_dump(exclude={"created_at", "confidence", "alignment_score"})
+    assert actual_fields == expected_fields
+    assert decision.confidence == pytest.approx(expected.confidence, abs=1e-6)
+    assert decision.alignment_score == pytest.approx(expected.alignment_score, abs=1e-6)
+
+
 class TestFilterScore:
     """Tests for filter scoring."""
 
@@ -105,5 +165,86 @@ class TestAlignmentScore:
         assert alignment > 0.7, "High component scores should yield high alignment"
 
 
+class TestEvaluateBatch:
+    """Tests that batched evaluation matches one evaluate() call per task."""
+
+    @pytest.mark.parametrize("matrix_form", ["float32", "quantized"])
+    @pytest.mark.parametrize("offload", [False, True])
+    def test_batch_matches_single(self, reasoning_engine, monkeypatch, matrix_form, offload):
+        """Test evaluate_batch against evaluate() on each task."""
+        tasks, embeddings, projects = _batch_fixture()
+        projects_matrix = None
+        if matrix_form == "quantized":
+            projects_matrix = stack_quantized_rows([p.quantized_embedding() for p in projects])
+
+        offloaded = []
+        if offload:
+            # Any product leaves the event loop
+            monkeypatch.setattr(reasoning, "SIMILARITY_OFFLOAD_MIN_SCORES", 0)
+            to_thread = asyncio.to_thread
+
+            async def spy(func, *args, **kwargs):
+                offloaded.append(func)
+                return await to_thread(func, *args, **kwargs)
+
+            monkeypatch.setattr(reasoning.asyncio, "to_thread", spy)
+
+        async def run():
+            batch = await reasoning_engine.evaluate_batch(tasks, embeddings, projects, projects_matrix)
+            batch_offloads = len(offloaded)
+            singles = [
+                await reasoning_engine.evaluate(task, embedding, projects, projects_matrix)
+                for task, embedding in zip(tasks, embeddings)
+            ]
+            return batch, batch_offloads, singles
+
+        batch, batch_offloads, singles = asyncio.run(run())
+
+        assert len(batch) == len(tasks)
+        for decision, expected in zip(batch, singles):
+            _assert_same_decision(decision, expected)
+        assert {d.decision for d in batch} == set(DecisionType)
+        # The whole batch is matched in one handoff
+        assert batch_offloads == (1 if offload else 0)
+
+    def test_early_exits_skip_matching(self, reasoning_engine, monkeypatch):
+        """Test that blank and filter-category tasks never reach similarity matching."""
+        tasks, embeddings, projects = _batch_fixture()
+        early = [tasks[1], tasks[2], tasks[6]]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("similarity matching ran for an early-exit task")
+
+        monkeypatch.setattr(reasoning_engine, "_find_similar_projects_batch", fail)
+        decisions = asyncio.run(
+            reasoning_engine.evaluate_batch(early, embeddings[:3], projects)
+        )
+
+        assert [d.decision for d in decisions] == [
+            DecisionType.CLARIFY, DecisionType.FILTER, DecisionType.CLARIFY
+        ]
+
+
+class TestQuantizedRescore:
+    """Tests for float32 rescoring of borderline int8 scores."""
+
+    def test_borderline_match_follows_float32(self, reasoning_engine):
+        """Test a project whose int8 score misses the threshold its float32 score clears."""
+        # Coarse 3-d vectors: int8 rounding moves this score across the threshold
+        query = np.array([3.0, 1.0, 0.0])
+        project = LinearProject(id="PRJ-EDGE", name="Edge", embedding=[7.0, 12.0, 0.0])
+        projects_matrix = stack_quantized_rows([project.quantized_embedding()])
+
+        exact = cosine_similarity(query, project.embedding_vector())
+        approx = batch_scores_quantized(query[None, :], projects_matrix)[0, 0]
+        assert approx < SIMILARITY_THRESHOLD_MATCH <= exact
+        assert SIMILARITY_THRESHOLD_MATCH - approx < QUANTIZED_RESCORE_MARGIN
+
+        matches = reasoning_engine._find_similar_projects(query, [project], projects_matrix)
+
+        assert [m.project.id for m in matches] == ["PRJ-EDGE"]
+        assert matches[0].similarity_score == pytest.approx(exact, abs=1e-6)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
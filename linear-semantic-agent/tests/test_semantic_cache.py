@@ -0,0 +1,81 @@
+"""
+Tests for the in-process decision cache.
+"""
+
+import pytest
+import numpy as np
+from src.cache.semantic_cache import SemanticCache
+from src.models.decision import Decision, DecisionType
+
+
+def _decision(reasoning: str) -> Decision:
+    """Build a minimal decision."""
+    return Decision(
+        decision=DecisionType.ADD,
+        confidence=0.9,
+        reasoning=reasoning,
+        suggested_action="Create new Linear project/issue",
+        alignment_score=0.8
+    )
+
+
+@pytest.fixture
+def cache():
+    """Create a small cache instance."""
+    return SemanticCache(dimension=3, capacity=2, threshold=0.95)
+
+
+class TestSemanticCache:
+    """Tests for exact and semantic lookups."""
+
+    def test_exact_hit(self, cache):
+        """Test lookup by identical description."""
+        decision = _decision("a")
+        cache.put("Build Slack MCP server", np.array([1.0, 0.0, 0.0]), decision)
+
+        assert cache.get_exact("Build Slack MCP server") is decision
+        assert cache.get_exact("Build Slack MCP servers") is None
+
+    def test_semantic_hit_above_threshold(self, cache):
+        """Test lookup by a nearby embedding."""
+        decision = _decision("a")
+        cache.put("Build Slack MCP server", np.array([1.0, 0.0, 0.0]), decision)
+
+        assert cache.get_similar(np.array([1.0, 0.05, 0.0])) is decision
+        assert cache.get_similar(np.array([1.0, 1.0, 0.0])) is None
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test that a full cache evicts the least recently used entry."""
+        cache.put("a", np.array([1.0, 0.0, 0.0]), _decision("a"))
+        cache.put("b", np.array([0.0, 1.0, 0.0]), _decision("b"))
+        cache.get_exact("a")
+        cache.put("c", np.array([0.0, 0.0, 1.0]), _decision("c"))
+
+        assert cache.get_exact("b") is None
+        assert cache.get_similar(np.array([0.0, 1.0, 0.0])) is None
+        assert cache.get_exact("a") is not None
+        assert len(cache) == 2
+
+    def test_clarify_not_cached(self, cache):
+        """Test that clarify decisions are never served from the cache."""
+        decision = Decision(
+            decision=DecisionType.CLARIFY,
+            confidence=0.3,
+            reasoning="Task description lacks clarity (clarity: 0.30)",
+            suggested_action="Request clarification from user",
+            alignment_score=0.3,
+            clarification_questions=["What exactly needs to be done?"]
+        )
+        cache.put("fix the thing", np.array([1.0, 0.0, 0.0]), decision)
+
+        assert cache.get_exact("fix the thing") is None
+        assert cache.get_similar(np.array([1.0, 0.01, 0.0])) is None
+        assert len(cache) == 0
+
+    def test_clear(self, cache):
+        """Test that clear drops all entries."""
+        cache.put("a", np.array([1.0, 0.0, 0.0]), _decision("a"))
+        cache.clear()
+
+        assert cache.get_exact("a") is None
+        assert cache.get_similar(np.array([1.0, 0.0, 0.0])) is None
@@ -6,13 +6,40 @@ import pytest
 import numpy as np
 from src.utils.similarity import (
     cosine_similarity,
+    cosine_similarity_matrix,
     find_most_similar,
+    find_most_similar_batch,
+    find_most_similar_normalized,
+    find_most_similar_quantized,
+    normalize,
+    batch_scores_normalized,
+    batch_scores_quantized,
+    normalize_rows,
+    quantize_rows,
+    quantize_vector,
+    top_matches,
+    classify,
     is_duplicate,
     is_exact_duplicate,
     is_related
 )
 
 
+def _graded_candidates(count: int, dim: int, seed: int):
+    """Random query and (count, dim) candidates at graded distances from it."""
+    rng = np.random.default_rng(seed)
+    query = rng.standard_normal(dim)
+    matrix = query + rng.uniform(0.2, 3.0, (count, 1)) * rng.standard_normal((count, dim))
+    return query, matrix
+
+
+def _assert_same_matches(matches, expected, tolerance=1e-6):
+    """Assert the same indices in the same order, with scores within tolerance."""
+    assert [idx for idx, _ in matches] == [idx for idx, _ in expected]
+    for (_, score), (_, expected_score) in zip(matches, expected):
+        assert score == pytest.approx(expected_score, abs=tolerance)
+
+
 class TestCosineSimilarity:
     """Tests for cosine similarity calculation."""
 
@@ -40,6 +67,57 @@ class TestCosineSimilarity:
         similarity = cosine_similarity(vec1, vec2)
         assert 0.9 < similarity < 1.0
 
+    @pytest.mark.parametrize("dim", [384, 768, 1024, 1536])
+    def test_cosine_similarity_embedding_size(self, dim):
+        """Test embedding-sized vectors agree with the norm-based formula."""
+        rng = np.random.default_rng(3)
+        vec1 = rng.standard_normal(dim).astype(np.float32)
+        vec2 = (vec1 + rng.standard_normal(dim)).astype(np.float32)
+
+        expected = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+
+        similarity = cosine_similarity(vec1, vec2)
+        assert similarity == pytest.approx(float(expected), abs=1e-6)
+
+    def test_i8_matches_f32_within_1pct(self):
+        """Test cosine similarity of int8-quantized vectors stays close to float32."""
+        rng = np.random.default_rng(5)
+        for _ in range(20):
+            vec1 = rng.standard_normal(768)
+            vec2 = vec1 + rng.uniform(0.1, 2.0) * rng.standard_normal(768)
+
+            (q1, s1), (q2, s2) = quantize_vector(vec1), quantize_vector(vec2)
+            approx = cosine_similarity(q1 * s1, q2 * s2)
+
+            assert approx == pytest.approx(cosine_similarity(vec1, vec2), abs=0.01)
+
+    def test_float64_inputs_scored_in_float32(self):
+        """Test float64 inputs are cast once and every score path stays float32."""
+        rng = np.random.default_rng(8)
+        queries = rng.standard_normal((2, 32))
+        candidates = rng.standard_normal((6, 32))
+        matrix = normalize_rows(candidates)
+
+        assert normalize(queries[0]).dtype == np.float32
+        assert matrix.dtype == np.float32
+        assert cosine_similarity_matrix(queries, candidates).dtype == np.float32
+        assert batch_scores_normalized(queries, matrix).dtype == np.float32
+        assert batch_scores_quantized(queries, quantize_rows(matrix)).dtype == np.float32
+
+    @pytest.mark.parametrize("dim", [3, 64, 768])
+    def test_cosine_similarity_matrix_matches_pairwise(self, dim):
+        """Test the matrix variant agrees with pairwise cosine similarity."""
+        rng = np.random.default_rng(dim)
+        queries = [rng.standard_normal(dim) for _ in range(3)]
+        candidates = [rng.standard_normal(dim) for _ in range(5)]
+
+        scores = cosine_similarity_matrix(queries, candidates)
+
+        assert scores.shape == (3, 5)
+        for i, query in enumerate(queries):
+            for j, candidate in enumerate(candidates):
+                assert scores[i, j] == pytest.approx(cosine_similarity(query, candidate), abs=1e-6)
+
 
 class TestFindMostSimilar:
     """Tests for finding most similar vectors."""
@@ -58,6 +136,139 @@ class TestFindMostSimilar:
         assert len(matches) >= 1, "Should find at least one match"
         assert matches[0][1] > 0.95, "First match should be highest similarity"
 
+    @pytest.mark.parametrize("candidate_form", ["matrix", "prenormalized", "memmap"])
+    def test_candidate_forms_match_list_path(self, candidate_form, tmp_path):
+        """Test every candidate representation gives the list path's matches."""
+        query, matrix = _graded_candidates(1000, 64, seed=7)
+        expected = find_most_similar(query, list(matrix), threshold=0.5)
+
+        if candidate_form == "matrix":
+            matches = find_most_similar(query, matrix.astype(np.float32), threshold=0.5)
+        elif candidate_form == "prenormalized":
+            matches = find_most_similar(query, normalize_rows(matrix), threshold=0.5, pre_normalized=True)
+        else:
+            # Written, closed and reopened read-only
+            path = tmp_path / "vectors.f32"
+            stored = np.memmap(path, dtype=np.float32, mode="w+", shape=matrix.shape)
+            stored[:] = matrix
+            stored.flush()
+            del stored
+            reopened = np.memmap(path, dtype=np.float32, mode="r", shape=matrix.shape)
+            matches = find_most_similar(query, reopened, threshold=0.5)
+
+        assert len(expected) > 10
+        _assert_same_matches(matches, expected)
+        assert find_most_similar(query, matrix[:0]) == []
+
+    def test_find_most_similar_orders_large_batch(self):
+        """Test ordering and scores over a 1000-candidate batch against per-pair scoring."""
+        query, matrix = _graded_candidates(1000, 128, seed=2)
+
+        matches = find_most_similar(query, list(matrix), threshold=0.5)
+        expected = sorted(
+            ((idx, cosine_similarity(query, candidate)) for idx, candidate in enumerate(matrix)),
+            key=lambda match: -match[1]
+        )
+        expected = [match for match in expected if match[1] >= 0.5]
+
+        assert len(matches) > 10
+        scores = [score for _, score in matches]
+        assert scores == sorted(scores, reverse=True)
+        assert {idx for idx, _ in matches} == {idx for idx, _ in expected}
+        for (_, score), (_, expected_score) in zip(matches, expected):
+            assert score == pytest.approx(expected_score, abs=1e-5)
+
+    def test_top_k_matches_full_sort(self):
+        """Test top_k selection returns the head of a full sort of all scores."""
+        query, matrix = _graded_candidates(2000, 48, seed=9)
+        scores = np.clip(normalize_rows(matrix) @ normalize(query), 0.0, 1.0)
+        order = [int(idx) for idx in np.argsort(-scores, kind="stable") if scores[idx] >= 0.5]
+
+        full = find_most_similar(query, matrix, threshold=0.5)
+
+        assert len(full) > 50
+        for k in (1, 7, 50):
+            assert [idx for idx, _ in find_most_similar(query, matrix, threshold=0.5, top_k=k)] == order[:k]
+        for k in (len(full), len(full) + 5):
+            assert find_most_similar(query, matrix, threshold=0.5, top_k=k) == full
+
+    def test_batch_matches_single(self):
+        """Test batched search gives each query's single-query result."""
+        _, matrix = _graded_candidates(60, 64, seed=11)
+        candidates = list(matrix)
+        candidates[7] = None
+        queries = matrix[:3]
+
+        for top_k in (None, 4):
+            batch = find_most_similar_batch(queries, candidates, threshold=0.2, top_k=top_k)
+            assert len(batch) == len(queries)
+            for query, matches in zip(queries, batch):
+                _assert_same_matches(
+                    matches, find_most_similar(query, candidates, threshold=0.2, top_k=top_k)
+                )
+
+        assert find_most_similar_batch(queries[:1], [None]) == [[]]
+
+    def test_normalized_wrapper_clips_like_prenormalized(self):
+        """Test find_most_similar_normalized is the pre_normalized path, clipping included."""
+        query = np.array([1.0, 0.0, 0.0])
+        matrix = normalize_rows([[1.0, 0.0, 0.0], [-1.0, 0.1, 0.0], [0.0, 1.0, 0.0]])
+
+        matches = find_most_similar_normalized(query, matrix, threshold=0.0)
+
+        assert matches == find_most_similar(query, matrix, threshold=0.0, pre_normalized=True)
+        assert [idx for idx, _ in matches] == [0, 1, 2]
+        assert all(0.0 <= score <= 1.0 for _, score in matches)
+
+    def test_find_most_similar_normalized_matches_list_path(self):
+        """Test the pre-normalized matrix path agrees with the list path."""
+        query = np.array([1.0, 2.0, 3.0])
+        candidates = [
+            np.array([1.0, 2.0, 3.0]),
+            np.array([0.0, 0.0, 1.0]),
+            np.array([1.1, 2.1, 2.9])
+        ]
+
+        expected = find_most_similar(query, candidates, threshold=0.75)
+        matches = find_most_similar_normalized(query, normalize_rows(candidates), threshold=0.75)
+
+        assert [idx for idx, _ in matches] == [idx for idx, _ in expected]
+        for (_, score), (_, expected_score) in zip(matches, expected):
+            assert score == pytest.approx(expected_score, abs=1e-5)
+
+
+    def test_find_most_similar_quantized_close_to_float(self):
+        """Test int8-quantized scores stay close to float32 scores."""
+        rng = np.random.default_rng(0)
+        query = rng.standard_normal(768)
+        candidates = [query + 0.3 * rng.standard_normal(768) for _ in range(20)]
+        matrix = normalize_rows(candidates)
+
+        expected = dict(find_most_similar_normalized(query, matrix, threshold=0.0))
+        matches = find_most_similar_quantized(query, quantize_rows(matrix), threshold=0.0)
+
+        assert len(matches) == len(expected)
+        for idx, score in matches:
+            assert score == pytest.approx(expected[idx], abs=0.01)
+
+    def test_batch_scores_match_single_query_paths(self):
+        """Test batched scoring and top-k selection agree with per-query search."""
+        rng = np.random.default_rng(1)
+        candidates = [rng.standard_normal(64) for _ in range(30)]
+        queries = np.stack([candidates[3] + 0.5 * rng.standard_normal(64) for _ in range(4)])
+        matrix = normalize_rows(candidates)
+        quantized = quantize_rows(matrix)
+
+        float_rows = top_matches(batch_scores_normalized(queries, matrix), threshold=0.0, k=5)
+        quantized_rows = top_matches(batch_scores_quantized(queries, quantized), threshold=0.0, k=5)
+
+        for query, float_row, quantized_row in zip(queries, float_rows, quantized_rows):
+            expected = find_most_similar_normalized(query, matrix, threshold=0.0)[:5]
+            assert [idx for idx, _ in float_row] == [idx for idx, _ in expected]
+            expected = find_most_similar_quantized(query, quantized, threshold=0.0)[:5]
+            assert [idx for idx, _ in quantized_row] == [idx for idx, _ in expected]
+
+
 
 class TestThresholdFunctions:
     """Tests for threshold-based functions."""
@@ -77,6 +288,19 @@ class TestThresholdFunctions:
         assert is_related(0.80) is True
         assert is_related(0.70) is False
 
+    def test_classify_vectorized(self):
+        """Test vectorized classification agrees with the scalar checks."""
+        rng = np.random.default_rng(6)
+        scores = np.concatenate([rng.random(10000), [0.75, 0.80, 0.90]])
+
+        levels = classify(scores)
+
+        assert levels.dtype == np.uint8
+        for score, level in zip(scores.tolist(), levels.tolist()):
+            assert (level >= 1) == is_related(score)
+            assert (level >= 2) == is_duplicate(score)
+            assert (level >= 3) == is_exact_duplicate(score)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
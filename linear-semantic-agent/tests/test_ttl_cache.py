@@ -0,0 +1,81 @@
+"""
+Tests for coroutine TTL memoization.
+"""
+
+import asyncio
+from src.utils.ttl_cache import async_ttl_cache
+
+
+class TestAsyncTTLCache:
+    """Tests for async_ttl_cache."""
+
+    def test_reuses_result_within_ttl(self):
+        """Test repeated and concurrent calls share one evaluation."""
+        calls = []
+
+        @async_ttl_cache(60)
+        async def health():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {"status": "healthy"}
+
+        async def run():
+            results = await asyncio.gather(*(health() for _ in range(5)))
+            return results + [await health()]
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(r == {"status": "healthy"} for r in results)
+
+    def test_refreshes_after_expiry(self):
+        """Test an expired result is recomputed."""
+        calls = []
+
+        @async_ttl_cache(0)
+        async def health():
+            calls.append(1)
+            return len(calls)
+
+        async def run():
+            return [await health(), await health()]
+
+        assert asyncio.run(run()) == [1, 2]
+
+    def test_exceptions_not_cached(self):
+        """Test a failed call is retried on the next request."""
+        calls = []
+
+        @async_ttl_cache(60)
+        async def health():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("firestore down")
+            return "ok"
+
+        async def run():
+            try:
+                await health()
+            except RuntimeError:
+                pass
+            return await health()
+
+        assert asyncio.run(run()) == "ok"
+        assert len(calls) == 2
+
+    def test_concurrent_calls_across_event_loops(self):
+        """Test contended calls work from a second event loop after the first closes."""
+        calls = []
+
+        @async_ttl_cache(0)
+        async def health():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "ok"
+
+        async def run():
+            return await asyncio.gather(*(health() for _ in range(3)))
+
+        assert asyncio.run(run()) == ["ok"] * 3
+        assert asyncio.run(run()) == ["ok"] * 3
+        assert len(calls) == 6